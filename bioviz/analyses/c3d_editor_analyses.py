@@ -197,25 +197,26 @@ class C3dEditorAnalyses:
 
         if reload_events_from_c3d:
             self.main_window.clear_events()
-            for i in range(c3d["parameters"]["EVENT"]["USED"]["value"][0]):
-                context = (
-                    c3d["parameters"]["EVENT"]["CONTEXTS"]["value"][i]
-                    if "CONTEXTS" in c3d["parameters"]["EVENT"]
-                    and len(c3d["parameters"]["EVENT"]["CONTEXTS"]["value"]) > 0
-                    else ""
-                )
-                label = (
-                    c3d["parameters"]["EVENT"]["LABELS"]["value"][i]
-                    if len(c3d["parameters"]["EVENT"]["LABELS"]["value"]) > 0
-                    else ""
-                )
+
+            event_parameters = c3d["parameters"]["EVENT"]
+            n_events = event_parameters["USED"]["value"][0]
+            if n_events == 0:
+                return
+
+            # The parameters are fetched once, not for each event
+            all_contexts = event_parameters["CONTEXTS"]["value"] if "CONTEXTS" in event_parameters else []
+            all_labels = event_parameters["LABELS"]["value"] if "LABELS" in event_parameters else []
+            all_times = event_parameters["TIMES"]["value"]
+            frame_rate = c3d["header"]["points"]["frame_rate"]
+            button_indices = dict()
+            for i, button in enumerate(self.event_buttons):
+                button_indices.setdefault(button.text(), i)
+            for i in range(n_events):
+                context = all_contexts[i] if len(all_contexts) > 0 else ""
+                label = all_labels[i] if len(all_labels) > 0 else ""
                 name = f"{context} {label}"
-                frame = (
-                    round(c3d["parameters"]["EVENT"]["TIMES"]["value"][1, i] * c3d["header"]["points"]["frame_rate"])
-                    - self.first_frame_c3d
-                )
-                button_index = [button.text() for button in self.event_buttons].index(name)
-                self.main_window.set_event(frame, name, color=self.event_colors[button_index][1])
+                frame = round(all_times[1, i] * frame_rate) - self.first_frame_c3d
+                self.main_window.set_event(frame, name, color=self.event_colors[button_indices[name]][1])
 
     def _create_event_button(self, text: str = None, save: bool = True):
         if text is None:
@@ -9,37 +9,34 @@ import sys
 
 import numpy as np
 from PyQt5 import QtWidgets
+from PyQt5.QtCore import QEventLoop
 from PyQt5.QtGui import QPalette, QColor
 import threading
 
-from vtk import (
+# Only import the VTK modules that are actually used. "import vtk" loads every VTK module, which is slow
+from vtkmodules.vtkCommonCore import VTK_FLOAT, VTK_UNSIGNED_CHAR, vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersSources import vtkArrowSource, vtkPlaneSource, vtkSphereSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkIOOggTheora import vtkOggTheoraWriter
+from vtkmodules.vtkRenderingCore import (
     vtkActor,
-    vtkCellArray,
-    vtkInteractorStyleTrackballCamera,
-    vtkLine,
-    vtkPoints,
-    vtkPolyData,
+    vtkGlyph3DMapper,
     vtkPolyDataMapper,
-    vtkPolyLine,
     vtkRenderer,
-    vtkSphereSource,
-    vtkUnsignedCharArray,
-    vtkOggTheoraWriter,
     vtkWindowToImageFilter,
-    vtkPolygon,
-    vtkExtractEdges,
-    vtkArrowSource,
-    vtkNamedColors,
-    vtkMath,
-    vtkMatrix4x4,
-    vtkMinimalStandardRandomSequence,
-    vtkTransform,
-    vtkTransformPolyDataFilter,
-    vtkPlaneSource,
-    vtkPNGWriter,
 )
 
-from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+# Register the OpenGL implementations of the rendering classes
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401
+
+from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+from vtkmodules.util.numpy_support import get_vtk_to_numpy_typemap, numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
+from vtkmodules.util.vtkConstants import VTK_ID_TYPE
 
 from pyomeca import Markers, Rototrans
 from .mesh import Mesh
@@ -51,6 +48,300 @@ if first.value:
     first.value = False
 
 
+# Arbitrary (but constant) axis used to complete the basis of the force arrows
+_ARBITRARY_FORCE_AXIS = np.random.default_rng(8775070).uniform(-10, 10, 3)
+
+
+def _markers_to_xyz(markers) -> np.ndarray:
+    """
+    Get the coordinates of one frame of markers as a 3xN array. For a DataArray or an ndarray this is a view on the
+    underlying data, no copy is made
+    Parameters
+    ----------
+    markers : Markers3d
+        One frame of markers (3xN, 4xN, 3xNx1 or 4xNx1)
+    """
+    data = np.asarray(markers)
+    if data.ndim > 2:
+        data = data[:, :, 0]
+    return data[0:3, :]
+
+
+def _markers_to_vtk_points(markers) -> vtkPoints:
+    """
+    Convert one frame of markers into a vtkPoints using a single contiguous copy. The points are stored in float32,
+    which is what the GPU ends up using anyway, so VTK does not have to convert them again
+    Parameters
+    ----------
+    markers : Markers3d
+        One frame of markers (3xN or 3xNx1)
+    """
+    arr = np.ascontiguousarray(_markers_to_xyz(markers).T, dtype=np.float32)
+    pts = vtkPoints()
+    pts.SetDataTypeToFloat()
+    pts.SetData(numpy_to_vtk(arr, deep=1))
+    return pts
+
+
+def _update_vtk_points(poly_data: vtkPolyData, markers):
+    """
+    Write one frame of markers into the points of a polydata. If the number of points did not change, the coordinates
+    are copied into the existing buffer instead of allocating a new vtkPoints
+    Parameters
+    ----------
+    poly_data : vtkPolyData
+        The polydata to update
+    markers : Markers3d
+        One frame of markers (3xN or 3xNx1)
+    """
+    data = _markers_to_xyz(markers)
+
+    points = poly_data.GetPoints()
+    if points is None or points.GetNumberOfPoints() != data.shape[1] or points.GetDataType() != VTK_FLOAT:
+        poly_data.SetPoints(_markers_to_vtk_points(data))
+        return
+    vtk_to_numpy(points.GetData())[:] = data.T
+    points.Modified()
+
+
+def _triangles_to_vtk_cells(triangles, close: bool) -> vtkCellArray:
+    """
+    Build the cells of a set of triangles from their connectivity array in one call
+    Parameters
+    ----------
+    triangles : np.ndarray
+        Indices of the vertices of each triangle (3xN)
+    close : bool
+        If the first index of each triangle should be repeated at the end so a polyline closes the triangle
+    """
+    triangles = np.asarray(triangles)
+    if close:
+        triangles = np.concatenate((triangles, triangles[0:1, :]))
+    return _connectivity_to_vtk_cells(triangles)
+
+
+def _connectivity_to_vtk_cells(connectivity) -> vtkCellArray:
+    """
+    Build cells that all have the same number of points from their connectivity array in one call, so the cell array
+    is allocated once at its final size
+    Parameters
+    ----------
+    connectivity : np.ndarray
+        Indices of the points of each cell (number of points per cell x number of cells)
+    """
+    connectivity = np.asarray(connectivity)
+    id_type = get_vtk_to_numpy_typemap()[VTK_ID_TYPE]
+    flat_connectivity = np.ascontiguousarray(connectivity.T, dtype=id_type).ravel()
+    offsets = np.arange(0, flat_connectivity.size + 1, connectivity.shape[0], dtype=id_type)
+
+    cells = vtkCellArray()
+    cells.SetData(numpy_to_vtkIdTypeArray(offsets, deep=1), numpy_to_vtkIdTypeArray(flat_connectivity, deep=1))
+    return cells
+
+
+def _new_axes_poly_data(length: float, n_axes: int = 1) -> vtkPolyData:
+    """
+    Create the polydata of systems of axes: the origin and the end of each axis joined by a red, a green and a blue line.
+    Each system of axes takes 4 consecutive points (the origin, then the end of x, y and z)
+    Parameters
+    ----------
+    length : float
+        Length of the axes
+    n_axes : int
+        Number of systems of axes
+    """
+    points = np.concatenate((np.zeros((3, 1)), np.identity(3) * length), axis=1)
+    connectivity = np.array([[0, 0, 0], [1, 2, 3]])[:, np.newaxis, :] + 4 * np.arange(n_axes)[:, np.newaxis]
+
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(_markers_to_vtk_points(np.tile(points, n_axes)))
+    poly_data.SetLines(_connectivity_to_vtk_cells(connectivity.reshape(2, -1)))
+    colors = np.tile(np.identity(3, dtype=np.uint8) * 255, (n_axes, 1))
+    poly_data.GetCellData().SetScalars(numpy_to_vtk(colors, deep=1, array_type=VTK_UNSIGNED_CHAR))
+    return poly_data
+
+
+def _rt_to_matrices(all_rt) -> np.ndarray:
+    """
+    Get one frame of several Rototrans as a (n_rt, 4, 4) array
+    Parameters
+    ----------
+    all_rt : Rototrans | list[Rototrans] | np.ndarray
+        One frame of each Rototrans, or their matrices already stacked in a (n_rt, 4, 4) array
+    """
+    if isinstance(all_rt, Rototrans):
+        all_rt = [all_rt]
+    if isinstance(all_rt, np.ndarray):
+        if all_rt.ndim != 3 or all_rt.shape[1:] != (4, 4):
+            raise IndexError("RT sent as an array should be stacked in a (n_rt, 4, 4) array")
+        return all_rt
+    if not isinstance(all_rt, list):
+        raise TypeError("Please send a list of rt to new_rt_set")
+
+    for rt in all_rt:
+        if rt.time.size != 1:
+            raise IndexError("RT should be from one frame only")
+    return np.array([np.asarray(rt)[:, :, 0] for rt in all_rt]).reshape(-1, 4, 4)
+
+
+def _rt_to_axes_points(matrices: np.ndarray, length: float) -> np.ndarray:
+    """
+    Compute the points of the polydata of _new_axes_poly_data for a set of homogeneous matrices
+    Parameters
+    ----------
+    matrices : np.ndarray
+        The homogeneous matrices (n_rt, 4, 4)
+    length : float
+        Length of the axes
+    """
+    origins = matrices[:, :3, 3:4]
+    points = np.concatenate((origins, origins + matrices[:, :3, :3] * length), axis=2)
+    return points.transpose(1, 0, 2).reshape(3, -1)
+
+
+def _concatenate_meshes(meshes) -> np.ndarray:
+    """
+    Stack the vertices of several meshes one after the other into a single 3xN array
+    Parameters
+    ----------
+    meshes : list[Mesh]
+        One frame of each mesh
+    """
+    return np.concatenate([_markers_to_xyz(mesh) for mesh in meshes], axis=1)
+
+
+def _update_vtk_points_from_meshes(poly_data: vtkPolyData, meshes):
+    """
+    Write one frame of several meshes into the points of a polydata, each mesh going to its own range of the points
+    buffer. This avoids concatenating the meshes into a temporary array before copying them
+    Parameters
+    ----------
+    poly_data : vtkPolyData
+        The polydata built from the meshes
+    meshes : list[Mesh]
+        One frame of each mesh
+    """
+    all_xyz = [_markers_to_xyz(mesh) for mesh in meshes]
+
+    points = poly_data.GetPoints()
+    n_points = sum(xyz.shape[1] for xyz in all_xyz)
+    if points is None or points.GetNumberOfPoints() != n_points or points.GetDataType() != VTK_FLOAT:
+        poly_data.SetPoints(_markers_to_vtk_points(np.concatenate(all_xyz, axis=1)))
+        return
+    buffer = vtk_to_numpy(points.GetData())
+    start = 0
+    for xyz in all_xyz:
+        buffer[start : start + xyz.shape[1]] = xyz.T
+        start += xyz.shape[1]
+    points.Modified()
+
+
+def _new_lines_poly_data(meshes) -> vtkPolyData:
+    """
+    Merge several meshes into a single polydata whose lines close each of their triangles. The indices of the triangles
+    of each mesh are shifted by the number of vertices of the meshes before it
+    Parameters
+    ----------
+    meshes : list[Mesh]
+        One frame of each mesh
+    """
+    n_vertices = [_markers_to_xyz(mesh).shape[1] for mesh in meshes]
+    offsets = np.cumsum([0] + n_vertices[:-1])
+    triangles = np.concatenate(
+        [np.asarray(mesh.triangles, dtype=int) + offset for mesh, offset in zip(meshes, offsets)], axis=1
+    )
+
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(_markers_to_vtk_points(_concatenate_meshes(meshes)))
+    poly_data.SetLines(_triangles_to_vtk_cells(triangles, close=True))
+    return poly_data
+
+
+def _new_meshes_poly_data(meshes, draw_patches) -> tuple[vtkPolyData, np.ndarray]:
+    """
+    Merge several meshes into a single polydata. The meshes without triangles are drawn vertex by vertex, the others
+    either as filled triangles (patches) or as polylines closing each triangle
+    Parameters
+    ----------
+    meshes : list[Mesh]
+        One frame of each mesh
+    draw_patches : list[bool]
+        If the triangles of each mesh should be filled
+
+    Returns
+    -------
+    The polydata and, for each of its cells, the index of the mesh it comes from (in the order VTK stores the cells,
+    that is the vertices, then the lines and then the polygons)
+    """
+    n_vertices = [_markers_to_xyz(mesh).shape[1] for mesh in meshes]
+    offsets = np.cumsum([0] + n_vertices[:-1])
+
+    cells = {"verts": [], "lines": [], "polys": []}
+    cell_meshes = {"verts": [], "lines": [], "polys": []}
+    for i, (mesh, offset, draw_patch) in enumerate(zip(meshes, offsets, draw_patches)):
+        if mesh.triangles.size == 0:
+            # Nothing to connect, only the vertices are drawn
+            kind, connectivity = "verts", np.arange(n_vertices[i])[np.newaxis, :]
+        elif draw_patch:
+            kind, connectivity = "polys", np.asarray(mesh.triangles, dtype=int)
+        else:
+            kind, connectivity = "lines", np.asarray(mesh.triangles, dtype=int)
+            connectivity = np.concatenate((connectivity, connectivity[0:1, :]))
+        cells[kind].append(connectivity + offset)
+        cell_meshes[kind].append(np.full(connectivity.shape[1], i))
+
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(_markers_to_vtk_points(_concatenate_meshes(meshes)))
+    if cells["verts"]:
+        poly_data.SetVerts(_connectivity_to_vtk_cells(np.concatenate(cells["verts"], axis=1)))
+    if cells["lines"]:
+        poly_data.SetLines(_connectivity_to_vtk_cells(np.concatenate(cells["lines"], axis=1)))
+    if cells["polys"]:
+        poly_data.SetPolys(_connectivity_to_vtk_cells(np.concatenate(cells["polys"], axis=1)))
+    return poly_data, np.concatenate(cell_meshes["verts"] + cell_meshes["lines"] + cell_meshes["polys"])
+
+
+def _as_mesh_list(meshes, kind: str) -> list:
+    """
+    Make sure the meshes are sent as a list, a single Mesh is wrapped into one
+    Parameters
+    ----------
+    meshes : Mesh | list[Mesh]
+        One frame of mesh or a list of them
+    kind : str
+        The kind of mesh (mesh, muscle, etc.), for the error message
+    """
+    if isinstance(meshes, Mesh):
+        return [meshes]
+    if not isinstance(meshes, list):
+        raise TypeError(f"Please send a list of {kind} to update_{kind}")
+    return meshes
+
+
+def _same_topology(mesh: Mesh, other: Mesh) -> bool:
+    """
+    If two meshes share the same triangles and number of vertices, meaning the cells of one can be reused to draw the
+    other
+    Parameters
+    ----------
+    mesh : Mesh
+        The new mesh
+    other : Mesh
+        The mesh the cells were built from
+    """
+    if mesh.automatic_triangles != other.automatic_triangles:
+        return False
+    if mesh.channel.size != other.channel.size:
+        # The cells of the merged meshes are offset by the number of vertices of the meshes before them
+        return False
+    if mesh.triangles.size == 0:
+        # Meshes without triangles are drawn vertex by vertex
+        return other.triangles.size == 0
+    if mesh.triangles is other.triangles:
+        return True
+    return mesh.triangles.shape == other.triangles.shape and np.array_equal(mesh.triangles, other.triangles)
+
+
 class VtkWindow(QtWidgets.QMainWindow):
     def __init__(self, background_color=(0, 0, 0)):
         """
@@ -77,12 +368,14 @@ class VtkWindow(QtWidgets.QMainWindow):
         self.interactor = self.avatar_widget.GetRenderWindow().GetInteractor()
         self.interactor.SetInteractorStyle(vtkInteractorStyleTrackballCamera())
         self.interactor.Initialize()
+        self._bg_color = None
         self.change_background_color(background_color)
 
         self.main_layout = QtWidgets.QGridLayout()
         self.main_layout.addWidget(self.avatar_widget)
         self.frame.setLayout(self.main_layout)
         self.video_recorder = vtkOggTheoraWriter()
+        self._created_dirs = set()
         self.is_fixed_sized = False
         self.minimum_size = self.minimumSize()
         self.maximum_size = self.maximumSize()
@@ -114,13 +407,21 @@ class VtkWindow(QtWidgets.QMainWindow):
         self.interactor.Render()
         app.processEvents()
 
+    def wait_for_events(self):
+        """
+        Sleep until something happens in the window (user interaction, timer, etc.) and process it. The camera
+        interactions are rendered by the interactor itself, so nothing has to be drawn in the meantime
+        """
+        app.processEvents(QEventLoop.WaitForMoreEvents)
+
     def get_camera_position(self) -> tuple:
         return self.ren.GetActiveCamera().GetPosition()
 
     def set_camera_position(self, x: float, y: float, z: float):
         cam = self.ren.GetActiveCamera()
+        if cam.GetPosition() == (x, y, z):
+            return
         cam.SetPosition(x, y, z)
-        self.ren.ResetCamera()
 
     def get_camera_roll(self) -> float:
         return self.ren.GetActiveCamera().GetRoll()
@@ -128,6 +429,12 @@ class VtkWindow(QtWidgets.QMainWindow):
     def set_camera_roll(self, roll: float):
         cam = self.ren.GetActiveCamera()
         cam.SetRoll(roll)
+
+    def reset_camera_to_scene(self):
+        """
+        Fit the camera to the bounds of all the actors of the scene. This traverses every actor, so it is left to the
+        caller to invoke it once after a series of camera changes
+        """
         self.ren.ResetCamera()
 
     def get_camera_zoom(self) -> float:
@@ -135,13 +442,18 @@ class VtkWindow(QtWidgets.QMainWindow):
 
     def set_camera_zoom(self, zoom: float):
         cam = self.ren.GetActiveCamera()
+        if cam.GetParallelScale() == 1 / zoom:
+            return
         cam.SetParallelScale(1 / zoom)
 
     def get_camera_focus_point(self) -> tuple:
         return self.ren.GetActiveCamera().GetFocalPoint()
 
     def set_camera_focus_point(self, x: float, y: float, z: float):
-        self.ren.GetActiveCamera().SetFocalPoint(x, y, z)
+        cam = self.ren.GetActiveCamera()
+        if cam.GetFocalPoint() == (x, y, z):
+            return
+        cam.SetFocalPoint(x, y, z)
 
     def change_background_color(self, color):
         """
@@ -150,6 +462,11 @@ class VtkWindow(QtWidgets.QMainWindow):
         ----------
         color : tuple(int)
         """
+        color = tuple(color)
+        if color == self._bg_color:
+            return
+        self._bg_color = color
+
         self.ren.SetBackground(color)
         self.setPalette(QPalette(QColor(int(color[0] * 255), int(color[1] * 255), int(color[2] * 255))))
 
@@ -160,10 +477,9 @@ class VtkWindow(QtWidgets.QMainWindow):
 
         w = vtkPNGWriter()
         folder_path = os.path.dirname(save_path)
-        try:
-            os.mkdir(folder_path)
-        except FileExistsError:
-            pass
+        if folder_path and folder_path not in self._created_dirs:
+            os.makedirs(folder_path, exist_ok=True)
+            self._created_dirs.add(folder_path)
 
         w.SetFileName(save_path)
         w.SetInputData(w2if.GetOutput())
@@ -184,14 +500,13 @@ class VtkWindow(QtWidgets.QMainWindow):
         windowToImageFilter.ReadFrontBufferOff()
         windowToImageFilter.Update()
 
-        was_true = []
-        for b in button_to_block:
-            was_true.append(b.isEnabled())
+        # Only toggle the buttons that are actually enabled, the others would not change state anyway
+        to_block = [b for b in button_to_block if b.isEnabled()]
+        for b in to_block:
             b.setEnabled(False)
         self.video_recorder.Write()
-        for i, b in enumerate(button_to_block):
-            if was_true[i]:
-                b.setEnabled(True)
+        for b in to_block:
+            b.setEnabled(True)
 
         if finish:
             self.video_recorder.End()
@@ -272,6 +587,13 @@ class VtkModel(QtWidgets.QWidget):
         self.setAutoFillBackground(True)
         self.setPalette(palette)
 
+        # Unit sphere shared by all the sphere sets, it is uploaded once and instanced on each point by the GPU
+        self._sphere_source = vtkSphereSource()
+        self._sphere_source.SetRadius(1)
+
+        # Arrow shared by the force and gravity vectors
+        self.arrow_source = self._new_arrow_source()
+
         self.markers = {
             "model": _MarkerInternal(
                 data=Markers(), color=markers_color, size=markers_size, opacity=markers_opacity, actors=list()
@@ -328,6 +650,7 @@ class VtkModel(QtWidgets.QWidget):
         self.mesh_opacity = mesh_opacity
         self.mesh_linewidth = mesh_linewidth
         self.mesh_actors = list()
+        self._mesh_of_each_cell = np.ndarray((0,), dtype=int)
 
         self.all_muscles = []
         self.muscle_color = muscle_color
@@ -385,8 +708,11 @@ class VtkModel(QtWidgets.QWidget):
         markers_color : tuple(int)
             Color the markers should be drawn (1 is max brightness)
         """
-        self.markers_color[key] = markers_color
-        self._update_markers(self.markers, key)
+        markers_color = tuple(markers_color)
+        if markers_color == tuple(self.markers[key].color):
+            return
+        self.markers[key].color = markers_color
+        self._update_markers_characteristics(key)
 
     def set_markers_size(self, markers_size):
         self._set_markers_size(markers_size, "model")
@@ -402,8 +728,10 @@ class VtkModel(QtWidgets.QWidget):
         markers_size : float
             Size the markers should be drawn
         """
-        self.markers_size[key] = markers_size
-        self._update_markers(self.markers, key)
+        if np.array_equal(markers_size, self.markers[key].size):
+            return
+        self.markers[key].size = markers_size
+        self._update_markers_characteristics(key)
 
     def set_markers_opacity(self, markers_opacity):
         self._set_markers_opacity(markers_opacity, "model")
@@ -422,8 +750,21 @@ class VtkModel(QtWidgets.QWidget):
         -------
 
         """
-        self.markers_opacity[key] = markers_opacity
-        self._update_markers(self.markers, key)
+        self.markers[key].opacity = markers_opacity
+        self._update_markers_characteristics(key)
+
+    def _update_markers_characteristics(self, key):
+        """
+        Apply the size, color and opacity of the markers to their actors, their positions are left untouched
+        Parameters
+        ----------
+        key : str
+            The marker set to update ("model" or "experimental")
+        """
+        for actor in self.markers[key].actors:
+            self._update_spheres_characteristics(
+                actor, self.markers[key].size, self.markers[key].color, self.markers[key].opacity
+            )
 
     def _new_marker_set(self, markers, key):
         """
@@ -441,18 +782,8 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.markers[key].actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.markers[key].actors = list()
-
-        # Create the geometry of a point (the coordinate) points = vtk.vtkPoints()
-        for i in range(markers.channel.size):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-
-            # Create an actor
-            self.markers[key].actors.append(vtkActor())
-            self.markers[key].actors[i].SetMapper(mapper)
-
-            self.parent_window.ren.AddActor(self.markers[key].actors[i])
+        self.markers[key].actors = [self._new_spheres_actor()]
+        self.parent_window.ren.AddActor(self.markers[key].actors[0])
 
         # Update marker position
         self._update_markers(self.markers[key].data, key)
@@ -478,7 +809,7 @@ class VtkModel(QtWidgets.QWidget):
         self._update_markers(markers, "experimental")
         if with_link:
             if virtual_to_experimental_markers_indices is None:
-                virtual_to_experimental_markers_indices = tuple(range(self.markers["model"].data.channel.size))
+                virtual_to_experimental_markers_indices = tuple(range(self.markers["model"].data.shape[1]))
             self._update_experimental_marker_link(virtual_to_experimental_markers_indices)
 
     def _update_markers(self, markers, key):
@@ -486,28 +817,90 @@ class VtkModel(QtWidgets.QWidget):
         Update position of the markers on the screen (but do not repaint)
         Parameters
         ----------
-        markers : Markers3d
-            One frame of markers
+        markers : Markers3d | np.ndarray
+            One frame of markers. A plain array (3xN or 4xN) is used as is, so a frame-major copy of a trajectory
+            can be sent without building a Markers for each frame
 
         """
 
         if len(markers.shape) > 2 and markers.shape[2] > 1:
             raise IndexError("Markers should be from one frame only")
-        if markers.channel.size != self.markers[key].data.channel.size:
+        if markers.shape[1] != self.markers[key].data.shape[1]:
             self._new_marker_set(markers, key)
             return  # Prevent calling update_markers recursively
         self.markers[key].data = markers
-        markers = np.array(markers)
-
-        for i, actor in enumerate(self.markers[key].actors):
-            # mapper = actors.GetNextActor().GetMapper()
-            mapper = actor.GetMapper()
-            self.markers[key].actors[i].GetProperty().SetColor(self.markers[key].color)
-            self.markers[key].actors[i].GetProperty().SetOpacity(self.markers[key].opacity)
-            source = vtkSphereSource()
-            source.SetCenter(markers[0:3, i])
-            source.SetRadius(self.markers[key].size)
-            mapper.SetInputConnection(source.GetOutputPort())
+
+        for actor in self.markers[key].actors:
+            self._update_spheres_actor(
+                actor, markers, self.markers[key].size, self.markers[key].color, self.markers[key].opacity
+            )
+
+    def _new_spheres_actor(self):
+        """
+        Create an actor that draws a sphere on each point of its input. All the spheres of a set are instanced from a
+        single polydata so their positions are sent to VTK in one contiguous copy and drawn in one call
+        """
+        mapper = vtkGlyph3DMapper()
+        mapper.SetSourceConnection(self._sphere_source.GetOutputPort())
+        mapper.SetInputData(vtkPolyData())
+        mapper.OrientOff()
+        mapper.ScalarVisibilityOff()
+
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        return actor
+
+    @staticmethod
+    def _update_spheres_actor(actor, markers, size, color, opacity):
+        """
+        Update the positions and the characteristics of the spheres drawn by an actor from _new_spheres_actor
+        Parameters
+        ----------
+        actor : vtkActor
+            The actor to update
+        markers : Markers3d
+            One frame of the centers of the spheres
+        size : float | list[float]
+            Radius of the spheres, either the same for all or one per sphere
+        color : tuple(int)
+            Color of the spheres (1 is max brightness)
+        opacity : float
+            Opacity of the spheres (0.0 is completely transparent, 1.0 completely opaque)
+        """
+        _update_vtk_points(actor.GetMapper().GetInput(), markers)
+        VtkModel._update_spheres_characteristics(actor, size, color, opacity)
+
+    @staticmethod
+    def _update_spheres_characteristics(actor, size, color, opacity):
+        """
+        Update the characteristics of the spheres drawn by an actor from _new_spheres_actor without touching their
+        positions
+        Parameters
+        ----------
+        actor : vtkActor
+            The actor to update
+        size : float | list[float]
+            Radius of the spheres, either the same for all or one per sphere
+        color : tuple(int)
+            Color of the spheres (1 is max brightness)
+        opacity : float
+            Opacity of the spheres (0.0 is completely transparent, 1.0 completely opaque)
+        """
+        mapper = actor.GetMapper()
+        poly_data = mapper.GetInput()
+        if np.ndim(size):
+            radii = numpy_to_vtk(np.asarray(size, dtype=np.float32), deep=1)
+            radii.SetName("radii")
+            poly_data.GetPointData().AddArray(radii)
+            mapper.SetScaleArray("radii")
+            mapper.SetScaleModeToScaleByMagnitude()
+            mapper.SetScaleFactor(1)
+        else:
+            mapper.SetScaleModeToNoDataScaling()
+            mapper.SetScaleFactor(size)
+
+        actor.GetProperty().SetColor(color)
+        actor.GetProperty().SetOpacity(opacity)
 
     def _new_experimental_marker_link(self, virtual_to_experimental_markers_indices):
         """
@@ -518,37 +911,22 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.markers_link_actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.markers_link_actors = list()
-
-        cells = vtkCellArray()
-        for i, j in enumerate(virtual_to_experimental_markers_indices):
-            if j is None:
-                continue
-            points = vtkPoints()
-            points.InsertNextPoint(self.markers["model"].data[:3, j, 0].data)
-            points.InsertNextPoint(self.markers["experimental"].data[:3, i, 0].data)
 
-            # Create the polygons
-            poly = vtkPolyLine()
-            poly.GetPointIds().SetNumberOfIds(2)  # make a line
-            poly.GetPointIds().SetId(0, 0)
-            poly.GetPointIds().SetId(1, 1)
-            cells.InsertNextCell(poly)
+        # All the links are drawn by one actor, link k joins the points 2k (virtual) and 2k + 1 (experimental)
+        n_links = len(tuple(i for i in virtual_to_experimental_markers_indices if i is not None))
+        poly_data = vtkPolyData()
+        poly_data.SetLines(_connectivity_to_vtk_cells(np.arange(2 * n_links).reshape(n_links, 2).T))
 
-            poly_data = vtkPolyData()
-            poly_data.SetPoints(points)
-            poly_data.SetLines(cells)
-
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputData(poly_data)
+        # Create a mapper
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(poly_data)
 
-            # Create an actor
-            self.markers_link_actors.append(vtkActor())
-            self.markers_link_actors[-1].SetMapper(mapper)
-            self.markers_link_actors[-1].GetProperty().SetColor((1, 0, 0))
+        # Create an actor
+        self.markers_link_actors = [vtkActor()]
+        self.markers_link_actors[0].SetMapper(mapper)
+        self.markers_link_actors[0].GetProperty().SetColor((1, 0, 0))
 
-            self.parent_window.ren.AddActor(self.markers_link_actors[-1])
+        self.parent_window.ren.AddActor(self.markers_link_actors[0])
 
         # Update marker position
         self._update_experimental_marker_link(virtual_to_experimental_markers_indices)
@@ -559,23 +937,18 @@ class VtkModel(QtWidgets.QWidget):
         Parameters
         """
 
-        if len(self.markers_link_actors) != len(
-            tuple(i for i in virtual_to_experimental_markers_indices if i is not None)
+        experimental_idx = [i for i, j in enumerate(virtual_to_experimental_markers_indices) if j is not None]
+        virtual_idx = [j for j in virtual_to_experimental_markers_indices if j is not None]
+        if not self.markers_link_actors or self.markers_link_actors[0].GetMapper().GetInput().GetNumberOfLines() != len(
+            virtual_idx
         ):
             self._new_experimental_marker_link(virtual_to_experimental_markers_indices)
             return  # Prevent calling update_markers recursively
 
-        cmp = 0
-        for i, j in enumerate(virtual_to_experimental_markers_indices):
-            if j is None:
-                continue
-            points = vtkPoints()
-            points.InsertNextPoint(self.markers["model"].data[:3, j, 0].data)
-            points.InsertNextPoint(self.markers["experimental"].data[:3, i, 0].data)
-
-            poly_line = self.markers_link_actors[cmp].GetMapper().GetInput()
-            poly_line.SetPoints(points)
-            cmp += 1
+        points = np.ndarray((3, 2 * len(virtual_idx)))
+        points[:, 0::2] = _markers_to_xyz(self.markers["model"].data)[:, virtual_idx]
+        points[:, 1::2] = _markers_to_xyz(self.markers["experimental"].data)[:, experimental_idx]
+        _update_vtk_points(self.markers_link_actors[0].GetMapper().GetInput(), points)
 
     def set_contacts_color(self, contacts_color):
         """
@@ -629,18 +1002,8 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.contacts_actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.contacts_actors = list()
-
-        # Create the geometry of a point (the coordinate) points = vtk.vtkPoints()
-        for i in range(contacts.channel.size):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-
-            # Create an actor
-            self.contacts_actors.append(vtkActor())
-            self.contacts_actors[i].SetMapper(mapper)
-
-            self.parent_window.ren.AddActor(self.contacts_actors[i])
+        self.contacts_actors = [self._new_spheres_actor()]
+        self.parent_window.ren.AddActor(self.contacts_actors[0])
 
         # Update marker position
         self.update_contacts(self.contacts)
@@ -661,17 +1024,9 @@ class VtkModel(QtWidgets.QWidget):
             self.new_contact_set(contacts)
             return  # Prevent calling update_contacts recursively
         self.contacts = contacts
-        contacts = np.array(contacts)
-
-        for i, actor in enumerate(self.contacts_actors):
-            # mapper = actors.GetNextActor().GetMapper()
-            mapper = actor.GetMapper()
-            self.contacts_actors[i].GetProperty().SetColor(self.contacts_color)
-            self.contacts_actors[i].GetProperty().SetOpacity(self.contacts_opacity)
-            source = vtkSphereSource()
-            source.SetCenter(contacts[0:3, i])
-            source.SetRadius(self.contacts_size)
-            mapper.SetInputConnection(source.GetOutputPort())
+
+        for actor in self.contacts_actors:
+            self._update_spheres_actor(actor, contacts, self.contacts_size, self.contacts_color, self.contacts_opacity)
 
     def set_soft_contacts_color(self, soft_contacts_color):
         """
@@ -725,18 +1080,8 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.soft_contacts_actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.soft_contacts_actors = list()
-
-        # Create the geometry of a point (the coordinate) points = vtk.vtkPoints()
-        for i in range(soft_contacts.channel.size):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-
-            # Create an actor
-            self.soft_contacts_actors.append(vtkActor())
-            self.soft_contacts_actors[i].SetMapper(mapper)
-
-            self.parent_window.ren.AddActor(self.soft_contacts_actors[i])
+        self.soft_contacts_actors = [self._new_spheres_actor()]
+        self.parent_window.ren.AddActor(self.soft_contacts_actors[0])
         # Update marker position
         self.update_soft_contacts(self.soft_contacts)
 
@@ -756,17 +1101,11 @@ class VtkModel(QtWidgets.QWidget):
             self.new_soft_contacts_set(soft_contacts)
             return  # Prevent calling update_soft_contacts recursively
         self.soft_contacts = soft_contacts
-        soft_contacts = np.array(soft_contacts)
-
-        for i, actor in enumerate(self.soft_contacts_actors):
-            # mapper = actors.GetNextActor().GetMapper()
-            mapper = actor.GetMapper()
-            self.soft_contacts_actors[i].GetProperty().SetColor(self.soft_contacts_color)
-            self.soft_contacts_actors[i].GetProperty().SetOpacity(self.soft_contacts_opacity)
-            source = vtkSphereSource()
-            source.SetCenter(soft_contacts[0:3, i])
-            source.SetRadius(self.soft_contacts_size[i])
-            mapper.SetInputConnection(source.GetOutputPort())
+
+        for actor in self.soft_contacts_actors:
+            self._update_spheres_actor(
+                actor, soft_contacts, self.soft_contacts_size, self.soft_contacts_color, self.soft_contacts_opacity
+            )
 
     def set_global_center_of_mass_color(self, global_center_of_mass_color):
         """
@@ -821,18 +1160,8 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.global_center_of_mass_actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.global_center_of_mass_actors = list()
-
-        # Create the geometry of a point (the coordinate) points = vtk.vtkPoints()
-        for i in range(global_center_of_mass.channel.size):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-
-            # Create an actor
-            self.global_center_of_mass_actors.append(vtkActor())
-            self.global_center_of_mass_actors[i].SetMapper(mapper)
-
-            self.parent_window.ren.AddActor(self.global_center_of_mass_actors[i])
+        self.global_center_of_mass_actors = [self._new_spheres_actor()]
+        self.parent_window.ren.AddActor(self.global_center_of_mass_actors[0])
 
         # Update marker position
         self.update_global_center_of_mass(self.global_center_of_mass)
@@ -854,15 +1183,14 @@ class VtkModel(QtWidgets.QWidget):
             return  # Prevent calling update_center_of_mass recursively
         self.global_center_of_mass = global_center_of_mass
 
-        for i, actor in enumerate(self.global_center_of_mass_actors):
-            # mapper = actors.GetNextActor().GetMapper()
-            mapper = actor.GetMapper()
-            self.global_center_of_mass_actors[i].GetProperty().SetColor(self.global_center_of_mass_color)
-            self.global_center_of_mass_actors[i].GetProperty().SetOpacity(self.global_center_of_mass_opacity)
-            source = vtkSphereSource()
-            source.SetCenter(global_center_of_mass[0:3, i])
-            source.SetRadius(self.global_center_of_mass_size)
-            mapper.SetInputConnection(source.GetOutputPort())
+        for actor in self.global_center_of_mass_actors:
+            self._update_spheres_actor(
+                actor,
+                global_center_of_mass,
+                self.global_center_of_mass_size,
+                self.global_center_of_mass_color,
+                self.global_center_of_mass_opacity,
+            )
 
     def set_segments_center_of_mass_color(self, segments_center_of_mass_color):
         """
@@ -917,18 +1245,8 @@ class VtkModel(QtWidgets.QWidget):
         # Remove previous actors from the scene
         for actor in self.segments_center_of_mass_actors:
             self.parent_window.ren.RemoveActor(actor)
-        self.segments_center_of_mass_actors = list()
-
-        # Create the geometry of a point (the coordinate) points = vtk.vtkPoints()
-        for i in range(segments_center_of_mass.channel.size):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-
-            # Create an actor
-            self.segments_center_of_mass_actors.append(vtkActor())
-            self.segments_center_of_mass_actors[i].SetMapper(mapper)
-
-            self.parent_window.ren.AddActor(self.segments_center_of_mass_actors[i])
+        self.segments_center_of_mass_actors = [self._new_spheres_actor()]
+        self.parent_window.ren.AddActor(self.segments_center_of_mass_actors[0])
 
         # Update marker position
         self.update_segments_center_of_mass(self.segments_center_of_mass)
@@ -950,15 +1268,14 @@ class VtkModel(QtWidgets.QWidget):
             return  # Prevent calling update_center_of_mass recursively
         self.segments_center_of_mass = segments_center_of_mass
 
-        for i, actor in enumerate(self.segments_center_of_mass_actors):
-            # mapper = actors.GetNextActor().GetMapper()
-            mapper = actor.GetMapper()
-            self.segments_center_of_mass_actors[i].GetProperty().SetColor(self.segments_center_of_mass_color)
-            self.segments_center_of_mass_actors[i].GetProperty().SetOpacity(self.segments_center_of_mass_opacity)
-            source = vtkSphereSource()
-            source.SetCenter(segments_center_of_mass[0:3, i])
-            source.SetRadius(self.segments_center_of_mass_size)
-            mapper.SetInputConnection(source.GetOutputPort())
+        for actor in self.segments_center_of_mass_actors:
+            self._update_spheres_actor(
+                actor,
+                segments_center_of_mass,
+                self.segments_center_of_mass_size,
+                self.segments_center_of_mass_color,
+                self.segments_center_of_mass_opacity,
+            )
 
     def set_mesh_color(self, mesh_color):
         """
@@ -969,7 +1286,27 @@ class VtkModel(QtWidgets.QWidget):
             Color the mesh should be drawn (1 is max brightness)
         """
         self.mesh_color = mesh_color
-        self.update_mesh(self.all_meshes)
+        if not self.mesh_actors:
+            return
+        # Only the wireframe meshes are drawn with mesh_color, the patches keep their own color
+        colors = self.mesh_actors[0].GetMapper().GetInput().GetCellData().GetScalars()
+        vtk_to_numpy(colors)[:] = self._mesh_colors()[self._mesh_of_each_cell]
+        colors.Modified()
+
+    def _draw_patches(self) -> list[bool]:
+        """
+        If the triangles of each mesh are filled (patch) or drawn as a wireframe
+        """
+        return [not mesh.automatic_triangles and not self.force_wireframe for mesh in self.all_meshes]
+
+    def _mesh_colors(self) -> np.ndarray:
+        """
+        The color each mesh is drawn with (number of meshes x 3)
+        """
+        colors = [
+            self.patch_color[i] if draw_patch else self.mesh_color for i, draw_patch in enumerate(self._draw_patches())
+        ]
+        return np.array(colors, dtype=float).reshape(-1, 3)
 
     def set_mesh_opacity(self, mesh_opacity):
         """
@@ -983,83 +1320,51 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         self.mesh_opacity = mesh_opacity
-        self.update_mesh(self.all_meshes)
+        for actor in self.mesh_actors:
+            actor.GetProperty().SetOpacity(self.mesh_opacity)
 
     def new_mesh_set(self, all_meshes):
         """
-        Define a new mesh set. This function must be called each time the number of meshes change
+        Define a new mesh set. This function must be called each time the number of meshes change. All the meshes are
+        merged into a single actor so each frame only has one set of points to send to the GPU
         Parameters
         ----------
         all_meshes : MeshCollection
             One frame of mesh
 
         """
-        if isinstance(all_meshes, Mesh):
-            mesh_tp = []
-            mesh_tp.append(all_meshes)
-            all_meshes = mesh_tp
-
-        if not isinstance(all_meshes, list):
-            raise TypeError("Please send a list of mesh to update_mesh")
-        self.all_meshes = all_meshes
+        all_meshes = _as_mesh_list(all_meshes, "mesh")
+        for mesh in all_meshes:
+            if mesh.time.size != 1:
+                raise IndexError("Mesh should be from one frame only")
 
         # Remove previous actors from the scene
         for actor in self.mesh_actors:
             self.parent_window.ren.RemoveActor(actor)
         self.mesh_actors = list()
+        self.all_meshes = all_meshes
+        if not self.all_meshes:
+            return
 
-        # Create the geometry of a point (the coordinate) points = vtkPoints()
-        for i, mesh in enumerate(self.all_meshes):
-            if mesh.time.size != 1:
-                raise IndexError("Mesh should be from one frame only")
-
-            points = vtkPoints()
-            for j in range(mesh.channel.size):
-                # points.InsertNextPoint([0, 0, 0])
-                points.InsertNextPoint(mesh.data[:3, j, 0].tolist())
-
-            # Create an array for each triangle
-            draw_patch = not mesh.automatic_triangles and not self.force_wireframe
-            if draw_patch:
-                poly_type = vtkPolygon
-                n_ids = 3
-                color = self.patch_color[i]
-            else:
-                poly_type = vtkPolyLine
-                n_ids = 4
-                color = self.mesh_color
-            cells = vtkCellArray()
-
-            # Create the polygons
-            for j in range(mesh.triangles.shape[1]):
-                poly = poly_type()
-                poly.GetPointIds().SetNumberOfIds(n_ids)  # make a tri
-                for k in range(len(mesh.triangles[:, j])):
-                    poly.GetPointIds().SetId(k, mesh.triangles[k, j])
-                if not draw_patch:
-                    poly.GetPointIds().SetId(3, mesh.triangles[0, j])  # Close the triangle
-                cells.InsertNextCell(poly)
-
-            poly_data = vtkPolyData()
-            poly_data.SetPoints(points)
-            if draw_patch:
-                poly_data.SetPolys(cells)
-            else:
-                poly_data.SetLines(cells)
+        poly_data, self._mesh_of_each_cell = _new_meshes_poly_data(self.all_meshes, self._draw_patches())
 
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputData(poly_data)
+        # Each cell is colored by the mesh it comes from
+        colors = numpy_to_vtk(self._mesh_colors()[self._mesh_of_each_cell], deep=1)
+        colors.SetName("colors")
+        poly_data.GetCellData().SetScalars(colors)
 
-            # Create an actor
-            self.mesh_actors.append(vtkActor())
-            self.mesh_actors[i].SetMapper(mapper)
-            self.mesh_actors[i].GetProperty().SetColor(color)
-            self.mesh_actors[i].GetProperty().SetOpacity(self.mesh_opacity)
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(poly_data)
+        mapper.SetScalarModeToUseCellData()
+        mapper.SetColorModeToDirectScalars()
 
-            self.parent_window.ren.AddActor(self.mesh_actors[i])
+        # Create an actor
+        self.mesh_actors.append(vtkActor())
+        self.mesh_actors[0].SetMapper(mapper)
+        self.mesh_actors[0].GetProperty().SetOpacity(self.mesh_opacity)
+        self.mesh_actors[0].GetProperty().SetLineWidth(self.mesh_linewidth)
 
-        # Update marker position
-        self.update_mesh(self.all_meshes)
+        self.parent_window.ren.AddActor(self.mesh_actors[0])
 
     def update_mesh(self, all_meshes):
         """
@@ -1070,35 +1375,23 @@ class VtkModel(QtWidgets.QWidget):
             One frame of mesh
 
         """
-        if isinstance(all_meshes, Mesh):
-            mesh_tp = []
-            mesh_tp.append(all_meshes)
-            all_meshes = mesh_tp
+        all_meshes = _as_mesh_list(all_meshes, "mesh")
 
-        for i, mesh in enumerate(all_meshes):
+        if len(all_meshes) != len(self.all_meshes):
+            self.new_mesh_set(all_meshes)
+            return  # Prevent calling update_mesh recursively
+        for mesh, previous_mesh in zip(all_meshes, self.all_meshes):
             if mesh.time.size != 1:
                 raise IndexError("Mesh should be from one frame only")
-
-            if len(self.all_meshes) <= i or mesh.channel.size != self.all_meshes[i].channel.size:
+            if not _same_topology(mesh, previous_mesh):
                 self.new_mesh_set(all_meshes)
-                return  # Prevent calling update_markers recursively
-
-        if not isinstance(all_meshes, list):
-            raise TypeError("Please send a list of mesh to update_mesh")
+                return
 
+        if self.mesh_actors:
+            _update_vtk_points_from_meshes(self.mesh_actors[0].GetMapper().GetInput(), all_meshes)
+            self.mesh_actors[0].GetProperty().SetLineWidth(self.mesh_linewidth)
         self.all_meshes = all_meshes
 
-        for i, mesh in enumerate(self.all_meshes):
-            points = vtkPoints()
-            n_vertex = mesh.channel.size
-            mesh = np.array(mesh)
-            for j in range(n_vertex):
-                points.InsertNextPoint(mesh[0:3, j])
-
-            poly_line = self.mesh_actors[i].GetMapper().GetInput()
-            poly_line.SetPoints(points)
-            self.mesh_actors[i].GetProperty().SetLineWidth(self.mesh_linewidth)
-
     def set_muscle_color(self, muscle_color):
         """
         Dynamically change the color of the muscles
@@ -1108,7 +1401,8 @@ class VtkModel(QtWidgets.QWidget):
             Color the muscles should be drawn
         """
         self.muscle_color = muscle_color
-        self.update_muscles(self.all_muscles)
+        for actor in self.muscle_actors:
+            actor.GetProperty().SetColor(self.muscle_color)
 
     def set_muscle_opacity(self, muscle_opacity):
         """
@@ -1122,68 +1416,36 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         self.muscle_opacity = muscle_opacity
-        self.update_muscle(self.all_muscles)
+        for actor in self.muscle_actors:
+            actor.GetProperty().SetOpacity(self.muscle_opacity)
 
     def new_muscle_set(self, all_muscles):
         """
-        Define a new muscle set. This function must be called each time the number of muscles change
+        Define a new muscle set. This function must be called each time the number of muscles change. All the muscles
+        are merged into a single actor
         Parameters
         ----------
         all_muscles : MeshCollection
             One frame of mesh
 
         """
-        if isinstance(all_muscles, Mesh):
-            musc_tp = []
-            musc_tp.append(all_muscles)
-            all_muscles = musc_tp
-
-        if not isinstance(all_muscles, list):
-            raise TypeError("Please send a list of muscle to update_muscle")
-        self.all_muscles = all_muscles
+        all_muscles = _as_mesh_list(all_muscles, "muscle")
+        for mesh in all_muscles:
+            if mesh.time.size != 1:
+                raise IndexError("Muscles should be from one frame only")
 
         # Remove previous actors from the scene
         for actor in self.muscle_actors:
             self.parent_window.ren.RemoveActor(actor)
         self.muscle_actors = list()
+        self.all_muscles = all_muscles
+        if not self.all_muscles:
+            return
 
-        # Create the geometry of a point (the coordinate) points = vtkPoints()
-        for i, mesh in enumerate(self.all_muscles):
-            if mesh.time.size != 1:
-                raise IndexError("Muscles should be from one frame only")
-
-            points = vtkPoints()
-            for j in range(mesh.channel.size):
-                points.InsertNextPoint([0, 0, 0])
-
-            # Create an array for each triangle
-            cell = vtkCellArray()
-            for j in range(mesh.triangles.shape[1]):  # For each triangle
-                line = vtkPolyLine()
-                line.GetPointIds().SetNumberOfIds(4)
-                for k in range(len(mesh.triangles[:, j])):  # For each index
-                    line.GetPointIds().SetId(k, mesh.triangles[k, j])
-                line.GetPointIds().SetId(3, mesh.triangles[0, j])  # Close the triangle
-                cell.InsertNextCell(line)
-            poly_line = vtkPolyData()
-            poly_line.SetPoints(points)
-            poly_line.SetLines(cell)
-
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputData(poly_line)
-
-            # Create an actor
-            self.muscle_actors.append(vtkActor())
-            self.muscle_actors[i].SetMapper(mapper)
-            self.muscle_actors[i].GetProperty().SetColor(self.muscle_color)
-            self.muscle_actors[i].GetProperty().SetOpacity(self.muscle_opacity)
-            self.muscle_actors[i].GetProperty().SetLineWidth(5)
-
-            self.parent_window.ren.AddActor(self.muscle_actors[i])
-
-        # Update marker position
-        self.update_muscle(self.all_muscles)
+        self.muscle_actors.append(
+            self._new_lines_actor(self.all_muscles, self.muscle_color, self.muscle_opacity, line_width=5)
+        )
+        self.parent_window.ren.AddActor(self.muscle_actors[0])
 
     def update_muscle(self, all_muscles):
         """
@@ -1194,33 +1456,49 @@ class VtkModel(QtWidgets.QWidget):
             One frame of muscle mesh
 
         """
-        if isinstance(all_muscles, Mesh):
-            musc_tp = []
-            musc_tp.append(all_muscles)
-            all_muscles = musc_tp
+        all_muscles = _as_mesh_list(all_muscles, "muscle")
+
+        if len(all_muscles) != len(self.all_muscles):
+            self.new_muscle_set(all_muscles)
+            return  # Prevent calling update_muscle recursively
 
         for i, muscle in enumerate(all_muscles):
             if muscle.time.size != 1:
                 raise IndexError("Muscle should be from one frame only")
 
-            if len(self.all_muscles) <= i or muscle.channel.size != self.all_muscles[i].channel.size:
+            if not _same_topology(muscle, self.all_muscles[i]):
                 self.new_muscle_set(all_muscles)
-                return  # Prevent calling update_markers recursively
-
-        if not isinstance(all_muscles, list):
-            raise TypeError("Please send a list of muscles to update_muscle")
+                return  # Prevent calling update_muscle recursively
 
+        if all_muscles:
+            _update_vtk_points_from_meshes(self.muscle_actors[0].GetMapper().GetInput(), all_muscles)
         self.all_muscles = all_muscles
 
-        for i, mesh in enumerate(self.all_muscles):
-            points = vtkPoints()
-            n_vertex = mesh.channel.size
-            mesh = np.array(mesh)
-            for j in range(n_vertex):
-                points.InsertNextPoint(mesh[0:3, j])
+    @staticmethod
+    def _new_lines_actor(meshes, color, opacity, line_width=None):
+        """
+        Create a single actor that draws the triangles of all the meshes as closed polylines
+        Parameters
+        ----------
+        meshes : list[Mesh]
+            One frame of each mesh
+        color : tuple(int)
+            Color the meshes should be drawn
+        opacity : float
+            Opacity of the meshes (0.0 is completely transparent, 1.0 completely opaque)
+        line_width : float
+            Width of the lines, the VTK default if None
+        """
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(_new_lines_poly_data(meshes))
 
-            poly_line = self.muscle_actors[i].GetMapper().GetInput()
-            poly_line.SetPoints(points)
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        actor.GetProperty().SetColor(color)
+        actor.GetProperty().SetOpacity(opacity)
+        if line_width is not None:
+            actor.GetProperty().SetLineWidth(line_width)
+        return actor
 
     def set_ligament_color(self, ligament_color):
         """
@@ -1231,7 +1509,8 @@ class VtkModel(QtWidgets.QWidget):
             Color the ligaments should be drawn
         """
         self.ligament_color = ligament_color
-        self.update_ligaments(self.all_ligaments)
+        for actor in self.ligament_actors:
+            actor.GetProperty().SetColor(self.ligament_color)
 
     def set_ligament_opacity(self, ligament_opacity):
         """
@@ -1245,68 +1524,36 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         self.ligament_opacity = ligament_opacity
-        self.update_ligament(self.all_ligaments)
+        for actor in self.ligament_actors:
+            actor.GetProperty().SetOpacity(self.ligament_opacity)
 
     def new_ligament_set(self, all_ligaments):
         """
-        Define a new ligament set. This function must be called each time the number of ligaments change
+        Define a new ligament set. This function must be called each time the number of ligaments change. All the
+        ligaments are merged into a single actor
         Parameters
         ----------
         all_ligaments : MeshCollection
             One frame of mesh
 
         """
-        if isinstance(all_ligaments, Mesh):
-            lig_tp = []
-            lig_tp.append(all_ligaments)
-            all_ligaments = lig_tp
-
-        if not isinstance(all_ligaments, list):
-            raise TypeError("Please send a list of ligament to update_ligament")
-        self.all_ligaments = all_ligaments
+        all_ligaments = _as_mesh_list(all_ligaments, "ligament")
+        for mesh in all_ligaments:
+            if mesh.time.size != 1:
+                raise IndexError("ligaments should be from one frame only")
 
         # Remove previous actors from the scene
         for actor in self.ligament_actors:
             self.parent_window.ren.RemoveActor(actor)
         self.ligament_actors = list()
+        self.all_ligaments = all_ligaments
+        if not self.all_ligaments:
+            return
 
-        # Create the geometry of a point (the coordinate) points = vtkPoints()
-        for i, mesh in enumerate(self.all_ligaments):
-            if mesh.time.size != 1:
-                raise IndexError("ligaments should be from one frame only")
-
-            points = vtkPoints()
-            for j in range(mesh.channel.size):
-                points.InsertNextPoint([0, 0, 0])
-
-            # Create an array for each triangle
-            cell = vtkCellArray()
-            for j in range(mesh.triangles.shape[1]):  # For each triangle
-                line = vtkPolyLine()
-                line.GetPointIds().SetNumberOfIds(4)
-                for k in range(len(mesh.triangles[:, j])):  # For each index
-                    line.GetPointIds().SetId(k, mesh.triangles[k, j])
-                line.GetPointIds().SetId(3, mesh.triangles[0, j])  # Close the triangle
-                cell.InsertNextCell(line)
-            poly_line = vtkPolyData()
-            poly_line.SetPoints(points)
-            poly_line.SetLines(cell)
-
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputData(poly_line)
-
-            # Create an actor
-            self.ligament_actors.append(vtkActor())
-            self.ligament_actors[i].SetMapper(mapper)
-            self.ligament_actors[i].GetProperty().SetColor(self.ligament_color)
-            self.ligament_actors[i].GetProperty().SetOpacity(self.ligament_opacity)
-            self.ligament_actors[i].GetProperty().SetLineWidth(5)
-
-            self.parent_window.ren.AddActor(self.ligament_actors[i])
-
-        # Update marker position
-        self.update_ligament(self.all_ligaments)
+        self.ligament_actors.append(
+            self._new_lines_actor(self.all_ligaments, self.ligament_color, self.ligament_opacity, line_width=5)
+        )
+        self.parent_window.ren.AddActor(self.ligament_actors[0])
 
     def update_ligament(self, all_ligaments):
         """
@@ -1317,34 +1564,24 @@ class VtkModel(QtWidgets.QWidget):
             One frame of ligament mesh
 
         """
-        if isinstance(all_ligaments, Mesh):
-            lig_tp = []
-            lig_tp.append(all_ligaments)
-            all_ligaments = lig_tp
+        all_ligaments = _as_mesh_list(all_ligaments, "ligament")
+
+        if len(all_ligaments) != len(self.all_ligaments):
+            self.new_ligament_set(all_ligaments)
+            return  # Prevent calling update_ligament recursively
 
         for i, ligament in enumerate(all_ligaments):
             if ligament.time.size != 1:
                 raise IndexError("ligament should be from one frame only")
 
-            if len(self.all_ligaments) <= i or ligament.channel.size != self.all_ligaments[i].channel.size:
+            if not _same_topology(ligament, self.all_ligaments[i]):
                 self.new_ligament_set(all_ligaments)
-                return  # Prevent calling update_markers recursively
-
-        if not isinstance(all_ligaments, list):
-            raise TypeError("Please send a list of ligaments to update_ligament")
+                return  # Prevent calling update_ligament recursively
 
+        if all_ligaments:
+            _update_vtk_points_from_meshes(self.ligament_actors[0].GetMapper().GetInput(), all_ligaments)
         self.all_ligaments = all_ligaments
 
-        for i, mesh in enumerate(self.all_ligaments):
-            points = vtkPoints()
-            n_vertex = mesh.channel.size
-            mesh = np.array(mesh)
-            for j in range(n_vertex):
-                points.InsertNextPoint(mesh[0:3, j])
-
-            poly_line = self.ligament_actors[i].GetMapper().GetInput()
-            poly_line.SetPoints(points)
-
     def set_wrapping_color(self, wrapping_color):
         """
         Dynamically change the color of the wrapping
@@ -1354,7 +1591,9 @@ class VtkModel(QtWidgets.QWidget):
             Color the wrapping should be drawn (1 is max brightness)
         """
         self.wrapping_color = wrapping_color
-        self.update_wrapping(self.all_wrappings)
+        for actors in self.wrapping_actors:
+            for actor in actors:
+                actor.GetProperty().SetColor(self.wrapping_color)
 
     def set_wrapping_opacity(self, wrapping_opacity):
         """
@@ -1368,67 +1607,39 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         self.wrapping_opacity = wrapping_opacity
-        self.update_wrapping(self.all_wrappings)
+        for actors in self.wrapping_actors:
+            for actor in actors:
+                actor.GetProperty().SetOpacity(self.wrapping_opacity)
 
     def new_wrapping_set(self, all_wrappings, seg):
         """
-        Define a new wrapping set. This function must be called each time the number of wrappings change
+        Define a new wrapping set. This function must be called each time the number of wrappings change. All the
+        wrappings of a segment are merged into a single actor
         Parameters
         ----------
         all_wrappings : MeshCollection
             One frame of wrapping
+        seg : int
+            Index of the segment the wrappings are attached to
 
         """
-        if isinstance(all_wrappings, Mesh):
-            wrapping_tp = []
-            wrapping_tp.append(all_wrappings)
-            all_wrappings = wrapping_tp
-
-        if not isinstance(all_wrappings, list):
-            raise TypeError("Please send a list of wrapping to update_wrapping")
-        self.all_wrappings[seg] = all_wrappings
+        all_wrappings = _as_mesh_list(all_wrappings, "wrapping")
+        for wrapping in all_wrappings:
+            if wrapping.time.size != 1:
+                raise IndexError("Mesh should be from one frame only")
 
         # Remove previous actors from the scene
         for actor in self.wrapping_actors[seg]:
             self.parent_window.ren.RemoveActor(actor)
         self.wrapping_actors[seg] = list()
+        self.all_wrappings[seg] = all_wrappings
+        if not self.all_wrappings[seg]:
+            return
 
-        # Create the geometry of a point (the coordinate) points = vtkPoints()
-        for i, wrapping in enumerate(self.all_wrappings[seg]):
-            if wrapping.time.size != 1:
-                raise IndexError("Mesh should be from one frame only")
-
-            points = vtkPoints()
-            for j in range(wrapping.channel.size):
-                points.InsertNextPoint([0, 0, 0])
-
-            # Create an array for each triangle
-            cell = vtkCellArray()
-            for j in range(wrapping.triangles.shape[1]):  # For each triangle
-                line = vtkPolyLine()
-                line.GetPointIds().SetNumberOfIds(4)
-                for k in range(len(wrapping.triangles[:, j])):  # For each index
-                    line.GetPointIds().SetId(k, wrapping.triangles[k, j])
-                line.GetPointIds().SetId(3, wrapping.triangles[0, j])  # Close the triangle
-                cell.InsertNextCell(line)
-            poly_line = vtkPolyData()
-            poly_line.SetPoints(points)
-            poly_line.SetLines(cell)
-
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputData(poly_line)
-
-            # Create an actor
-            self.wrapping_actors[seg].append(vtkActor())
-            self.wrapping_actors[seg][i].SetMapper(mapper)
-            self.wrapping_actors[seg][i].GetProperty().SetColor(self.wrapping_color)
-            self.wrapping_actors[seg][i].GetProperty().SetOpacity(self.wrapping_opacity)
-
-            self.parent_window.ren.AddActor(self.wrapping_actors[seg][i])
-
-        # # Update marker position
-        # self.update_wrapping(self.all_wrappings)
+        self.wrapping_actors[seg].append(
+            self._new_lines_actor(self.all_wrappings[seg], self.wrapping_color, self.wrapping_opacity)
+        )
+        self.parent_window.ren.AddActor(self.wrapping_actors[seg][0])
 
     def update_wrapping(self, all_wrappings):
         """
@@ -1440,104 +1651,49 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         if not self.all_wrappings:
-            self.all_wrappings = [[]] * len(all_wrappings)
-            self.wrapping_actors = [[]] * len(all_wrappings)
+            self.all_wrappings = [[] for _ in range(len(all_wrappings))]
+            self.wrapping_actors = [[] for _ in range(len(all_wrappings))]
 
         for seg, wrappings in enumerate(all_wrappings):
-            for i, wrapping in enumerate(wrappings):
-                if wrapping.time.size != 1:
-                    raise IndexError("Mesh should be from one frame only")
-
-                if (
-                    len(self.all_wrappings[seg]) <= i
-                    or wrapping.channel.size != self.all_wrappings[seg][i].channel.size
-                ):
-                    self.new_wrapping_set(wrappings, seg)
-                    # return  # Prevent calling update_markers recursively
-
             if not isinstance(wrappings, list):
                 raise TypeError("Please send a list of wrapping to update_wrapping")
 
-            self.all_wrappings[seg] = wrappings
+            previous = self.all_wrappings[seg]
+            if len(wrappings) != len(previous) or not all(
+                _same_topology(wrapping, other) for wrapping, other in zip(wrappings, previous)
+            ):
+                self.new_wrapping_set(wrappings, seg)
+                continue
 
-            for i, wrapping in enumerate(self.all_wrappings[seg]):
-                points = vtkPoints()
-                n_vertex = wrapping.channel.size
-                wrapping = np.array(wrapping)
-                for j in range(n_vertex):
-                    points.InsertNextPoint(wrapping[0:3, j])
+            for wrapping in wrappings:
+                if wrapping.time.size != 1:
+                    raise IndexError("Mesh should be from one frame only")
 
-                poly_line = self.wrapping_actors[seg][i].GetMapper().GetInput()
-                poly_line.SetPoints(points)
+            self.all_wrappings[seg] = wrappings
+            if wrappings:
+                _update_vtk_points_from_meshes(self.wrapping_actors[seg][0].GetMapper().GetInput(), wrappings)
 
     def new_rt_set(self, all_rt):
         """
-        Define a new rt set. This function must be called each time the number of rt change
+        Define a new rt set. This function must be called each time the number of rt change. All the systems of axes
+        are drawn by a single actor
         Parameters
         ----------
-        all_rt : Rototrans
-            One frame of all Rototrans to draw
+        all_rt : Rototrans | list[Rototrans] | np.ndarray
+            One frame of all Rototrans to draw, or their matrices stacked in a (n_rt, 4, 4) array
 
         """
-        if isinstance(all_rt, Rototrans):
-            rt_tp = []
-            rt_tp.append(all_rt[:, :])
-            all_rt = rt_tp
-
-        if not isinstance(all_rt, list):
-            raise TypeError("Please send a list of rt to new_rt_set")
+        matrices = _rt_to_matrices(all_rt)
 
         # Remove previous actors from the scene
         for actor in self.rt_actors:
             self.parent_window.ren.RemoveActor(actor)
         self.rt_actors = list()
 
-        for i, rt in enumerate(all_rt):
-            if rt.time.size != 1:
-                raise IndexError("RT should be from one frame only")
-
-            # Create the polyline which will hold the actors
-            lines_poly_data = vtkPolyData()
-
-            # Create four points of a generic system of axes
-            pts = vtkPoints()
-            pts.InsertNextPoint([0, 0, 0])
-            pts.InsertNextPoint([1, 0, 0])
-            pts.InsertNextPoint([0, 1, 0])
-            pts.InsertNextPoint([0, 0, 1])
-            lines_poly_data.SetPoints(pts)
-
-            # Create the first line(between Origin and P0)
-            line0 = vtkLine()
-            line0.GetPointIds().SetId(0, 0)
-            line0.GetPointIds().SetId(1, 1)
-
-            # Create the second line(between Origin and P1)
-            line1 = vtkLine()
-            line1.GetPointIds().SetId(0, 0)
-            line1.GetPointIds().SetId(1, 2)
-
-            # Create the second line(between Origin and P1)
-            line2 = vtkLine()
-            line2.GetPointIds().SetId(0, 0)
-            line2.GetPointIds().SetId(1, 3)
-
-            # Create a vtkCellArray container and store the lines in it
-            lines = vtkCellArray()
-            lines.InsertNextCell(line0)
-            lines.InsertNextCell(line1)
-            lines.InsertNextCell(line2)
-
-            # Add the lines to the polydata container
-            lines_poly_data.SetLines(lines)
-
-            # Create a vtkUnsignedCharArray container and store the colors in it
-            colors = vtkUnsignedCharArray()
-            colors.SetNumberOfComponents(3)
-            colors.InsertNextTuple([255, 0, 0])
-            colors.InsertNextTuple([0, 255, 0])
-            colors.InsertNextTuple([0, 0, 255])
-            lines_poly_data.GetCellData().SetScalars(colors)
+        self.n_rt = matrices.shape[0]
+        if self.n_rt:
+            # Create generic systems of axes, their points are moved by update_rt
+            lines_poly_data = _new_axes_poly_data(1, self.n_rt)
 
             # Create a mapper
             mapper = vtkPolyDataMapper()
@@ -1545,52 +1701,34 @@ class VtkModel(QtWidgets.QWidget):
 
             # Create an actor
             self.rt_actors.append(vtkActor())
-            self.rt_actors[i].SetMapper(mapper)
-            self.rt_actors[i].GetProperty().SetLineWidth(self.rt_width)
+            self.rt_actors[0].SetMapper(mapper)
+            self.rt_actors[0].GetProperty().SetLineWidth(self.rt_width)
 
-            self.parent_window.ren.AddActor(self.rt_actors[i])
+            self.parent_window.ren.AddActor(self.rt_actors[0])
 
         # Set rt orientations
-        self.n_rt = len(all_rt)
-        self.update_rt(all_rt)
+        self.update_rt(matrices)
 
     def update_rt(self, all_rt):
         """
         Update position of the Rototrans on the screen (but do not repaint)
         Parameters
         ----------
-        all_rt : RototransCollection
-            One frame of all Rototrans to draw
+        all_rt : Rototrans | list[Rototrans] | np.ndarray
+            One frame of all Rototrans to draw, or their matrices stacked in a (n_rt, 4, 4) array
 
         """
-        if isinstance(all_rt, Rototrans):
-            rt_tp = []
-            rt_tp.append(all_rt[:, :])
-            all_rt = rt_tp
+        matrices = _rt_to_matrices(all_rt)
 
-        if len(all_rt) != self.n_rt:
-            self.new_rt_set(all_rt)
+        if matrices.shape[0] != self.n_rt:
+            self.new_rt_set(matrices)
             return  # Prevent calling update_rt recursively
 
-        if not isinstance(all_rt, list):
-            raise TypeError("Please send a list of rt to new_rt_set")
-
         self.all_rt = all_rt
-
-        for i, rt in enumerate(self.all_rt):
-            if rt.time.size != 1:
-                raise IndexError("RT should be from one frame only")
-
-            # Update the end points of the axes and the origin
-            pts = vtkPoints()
-            pts.InsertNextPoint(rt.meca.translation)
-            pts.InsertNextPoint(rt.meca.translation + rt.isel(col=0)[0:3] * self.rt_length)
-            pts.InsertNextPoint(rt.meca.translation + rt.isel(col=1)[0:3] * self.rt_length)
-            pts.InsertNextPoint(rt.meca.translation + rt.isel(col=2)[0:3] * self.rt_length)
-
-            # Update polydata in mapper
-            lines_poly_data = self.rt_actors[i].GetMapper().GetInput()
-            lines_poly_data.SetPoints(pts)
+        if self.n_rt:
+            # Update the end points of the axes and the origins
+            lines_poly_data = self.rt_actors[0].GetMapper().GetInput()
+            _update_vtk_points(lines_poly_data, _rt_to_axes_points(matrices, self.rt_length))
 
     def create_global_ref_frame(self):
         """
@@ -1606,48 +1744,8 @@ class VtkModel(QtWidgets.QWidget):
             raise RuntimeError("create_global_ref_frame should only be called once")
         self.has_global_ref_frame = True
 
-        # Create the polyline which will hold the actors
-        lines_poly_data = vtkPolyData()
-
-        # Create four points of a generic system of axes
-        pts = vtkPoints()
-        pts.InsertNextPoint([0, 0, 0])
-        pts.InsertNextPoint([self.global_ref_frame_length, 0, 0])
-        pts.InsertNextPoint([0, self.global_ref_frame_length, 0])
-        pts.InsertNextPoint([0, 0, self.global_ref_frame_length])
-        lines_poly_data.SetPoints(pts)
-
-        # Create the first line(between Origin and P0)
-        line0 = vtkLine()
-        line0.GetPointIds().SetId(0, 0)
-        line0.GetPointIds().SetId(1, 1)
-
-        # Create the second line(between Origin and P1)
-        line1 = vtkLine()
-        line1.GetPointIds().SetId(0, 0)
-        line1.GetPointIds().SetId(1, 2)
-
-        # Create the second line(between Origin and P1)
-        line2 = vtkLine()
-        line2.GetPointIds().SetId(0, 0)
-        line2.GetPointIds().SetId(1, 3)
-
-        # Create a vtkCellArray container and store the lines in it
-        lines = vtkCellArray()
-        lines.InsertNextCell(line0)
-        lines.InsertNextCell(line1)
-        lines.InsertNextCell(line2)
-
-        # Add the lines to the polydata container
-        lines_poly_data.SetLines(lines)
-
-        # Create a vtkUnsignedCharArray container and store the colors in it
-        colors = vtkUnsignedCharArray()
-        colors.SetNumberOfComponents(3)
-        colors.InsertNextTuple([255, 0, 0])
-        colors.InsertNextTuple([0, 255, 0])
-        colors.InsertNextTuple([0, 0, 255])
-        lines_poly_data.GetCellData().SetScalars(colors)
+        # Create the system of axes
+        lines_poly_data = _new_axes_poly_data(self.global_ref_frame_length)
 
         # Create a mapper
         mapper = vtkPolyDataMapper()
@@ -1669,6 +1767,8 @@ class VtkModel(QtWidgets.QWidget):
             Color the force should be drawn (1 is max brightness)
         """
         self.force_color = force_color
+        for actor in self.force_actors:
+            actor.GetProperty().SetColor(self.force_color)
 
     def set_force_opacity(self, force_opacity):
         """
@@ -1682,6 +1782,8 @@ class VtkModel(QtWidgets.QWidget):
 
         """
         self.force_opacity = force_opacity
+        for actor in self.force_actors:
+            actor.GetProperty().SetOpacity(self.force_opacity)
 
     def new_force_set(self, segment_jcs, all_forces, max_forces, normalization_ratio):
         """
@@ -1695,6 +1797,24 @@ class VtkModel(QtWidgets.QWidget):
         max_forces : list
             list of maximal force for each segment on all frames
 
+        """
+        self.all_forces = all_forces
+        # Remove previous actors from the scene
+        for actor in self.force_actors:
+            self.parent_window.ren.RemoveActor(actor)
+
+        # Create an actor
+        self.force_actors = [self._new_arrows_actor(self.arrow_source)]
+        self.parent_window.ren.AddActor(self.force_actors[0])
+
+        # Set rt orientations
+        self.n_force = len(all_forces)
+        self.update_force(segment_jcs, all_forces, max_forces, normalization_ratio)
+
+    @staticmethod
+    def _new_arrow_source():
+        """
+        Create the arrow drawn for the force and gravity vectors
         """
         # Arrow visualization parameters
         arrow_source = vtkArrowSource()
@@ -1703,38 +1823,49 @@ class VtkModel(QtWidgets.QWidget):
         arrow_source.SetShaftRadius(0.015)
         arrow_source.SetTipLength(0.2)
         arrow_source.SetTipRadius(0.08)
+        return arrow_source
 
-        self.arrow_source = arrow_source
-
-        transform = vtkTransform()
-
-        transform_polydata = vtkTransformPolyDataFilter()
-        transform_polydata.SetTransform(transform)
-        transform_polydata.SetInputConnection(arrow_source.GetOutputPort())
-
-        self.all_forces = all_forces
-        # Remove previous actors from the scene
-        for actor in self.force_actors:
-            self.parent_window.ren.RemoveActor(actor)
-        self.force_actors = list()
-
-        for i, forces in enumerate(all_forces):
-            # Create a mapper
-            mapper = vtkPolyDataMapper()
-            mapper.SetInputConnection(transform_polydata.GetOutputPort())
-
-            # Create an actor
-            self.force_actors.append(vtkActor())
-            self.force_actors[i].SetMapper(mapper)
-            self.force_actors[i].GetProperty().SetColor(self.force_color)
-            self.force_actors[i].GetProperty().SetOpacity(self.force_opacity)
+    @staticmethod
+    def _new_arrows_actor(arrow_source):
+        """
+        Create an actor that draws an arrow on each point of its input. The arrows are instanced by the GPU from a
+        single polydata, oriented and scaled by their "force" vector
+        Parameters
+        ----------
+        arrow_source : vtkArrowSource
+            The arrow to draw
+        """
+        mapper = vtkGlyph3DMapper()
+        mapper.SetSourceConnection(arrow_source.GetOutputPort())
+        mapper.SetInputData(vtkPolyData())
+        mapper.SetOrientationArray("force")
+        mapper.SetOrientationModeToDirection()
+        mapper.SetScaleArray("force")
+        mapper.SetScaleModeToScaleByMagnitude()
+        mapper.ScalarVisibilityOff()
 
-            self.parent_window.ren.AddActor(self.force_actors[i])
-            # self.parent_window.ren.ResetCamera()
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        return actor
 
-        # Set rt orientations
-        self.n_force = len(all_forces)
-        self.update_force(segment_jcs, all_forces, max_forces, normalization_ratio)
+    @staticmethod
+    def _update_arrows_actor(actor, application_points, vectors):
+        """
+        Update the arrows drawn by an actor from _new_arrows_actor
+        Parameters
+        ----------
+        actor : vtkActor
+            The actor to update
+        application_points : np.ndarray
+            The starting point of each arrow (3xN)
+        vectors : np.ndarray
+            The vector from the start to the tip of each arrow (3xN)
+        """
+        poly_data = actor.GetMapper().GetInput()
+        _update_vtk_points(poly_data, application_points)
+        force = numpy_to_vtk(np.ascontiguousarray(np.asarray(vectors).T, dtype=np.float32), deep=1)
+        force.SetName("force")
+        poly_data.GetPointData().AddArray(force)
 
     @staticmethod
     def compute_basis_force(application_point, magnitude_point):
@@ -1750,38 +1881,30 @@ class VtkModel(QtWidgets.QWidget):
         ----------
             matrix of the transformation and the length of the arrow.
         """
-        # Compute a basis
-        normalizedX = [0.0] * 3
-        normalizedY = [0.0] * 3
-        normalizedZ = [0.0] * 3
-
         # The X axis is a vector from start to end
-        vtkMath.Subtract(magnitude_point, application_point, normalizedX)
-        length = vtkMath.Norm(normalizedX)
-        vtkMath.Normalize(normalizedX)
-
-        rng = vtkMinimalStandardRandomSequence()
-        rng.SetSeed(8775070)
-        max_r = 10.0
+        application_point = np.asarray(application_point, dtype=float).reshape(3)
+        magnitude_point = np.asarray(magnitude_point, dtype=float).reshape(3)
+        normalized_x = magnitude_point - application_point
+        length = np.linalg.norm(normalized_x)
+        if length:
+            normalized_x /= length
 
         # The Z axis is an arbitrary vector cross X
-        arbitrary = [0.0] * 3
-        for i in range(0, 3):
-            arbitrary[i] = rng.GetRangeValue(-max_r, max_r)
-            rng.Next()
-        vtkMath.Cross(normalizedX, arbitrary, normalizedZ)
-        vtkMath.Normalize(normalizedZ)
+        normalized_z = np.cross(normalized_x, _ARBITRARY_FORCE_AXIS)
+        norm_z = np.linalg.norm(normalized_z)
+        if norm_z:
+            normalized_z /= norm_z
 
         # The Y axis is Z cross X
-        vtkMath.Cross(normalizedZ, normalizedX, normalizedY)
-        matrix = vtkMatrix4x4()
+        normalized_y = np.cross(normalized_z, normalized_x)
 
         # Create the direction cosine matrix
-        matrix.Identity()
-        for i in range(0, 3):
-            matrix.SetElement(i, 0, normalizedX[i])
-            matrix.SetElement(i, 1, normalizedY[i])
-            matrix.SetElement(i, 2, normalizedZ[i])
+        rotation = np.identity(4)
+        rotation[:3, 0] = normalized_x
+        rotation[:3, 1] = normalized_y
+        rotation[:3, 2] = normalized_z
+        matrix = vtkMatrix4x4()
+        matrix.DeepCopy(rotation.ravel())
 
         return matrix, length
 
@@ -1799,44 +1922,31 @@ class VtkModel(QtWidgets.QWidget):
         normalization_ratio : float
             ratio to normalize force for visualization
         """
-        if self.all_forces == []:
+        if not self.force_actors:
             self.new_force_set(segment_jcs, all_forces, max_forces, normalization_ratio)
             return  # Prevent calling update_markers recursively
 
         self.max_forces = max_forces
         self.all_forces = all_forces
-        for i, forces in enumerate(all_forces):
-            # Express force from current segment basis to global basis
-            rot_seg = segment_jcs[i][:3, :3]
-            trans_seg = segment_jcs[i][:-1, 3:]
-            force_magnitude = np.dot(rot_seg, forces[3:, :])
-            force_magnitude = force_magnitude + trans_seg
-            force_application = np.dot(rot_seg, forces[:3, :])
-            force_application = force_application + trans_seg
-            application_point = [force_application[0, :], force_application[1, :], force_application[2, :]]
-            magnitude_point = [force_magnitude[0, :], force_magnitude[1, :], force_magnitude[2, :]]
-            # Compute a basis for the arrow scaling
-            matrix, length = self.compute_basis_force(application_point, magnitude_point)
-            # Normalize force for visualization
-            length = length * normalization_ratio / max_forces[i]
-            transform = vtkTransform()
-            transform.Translate(application_point)
-            transform.Concatenate(matrix)
-            transform.Scale(length, length, length)
 
-            # Create an actor
-            mapper = self.force_actors[i].GetMapper()
-            transform_polydata = vtkTransformPolyDataFilter()
-            transform_polydata.SetTransform(transform)
-            transform_polydata.SetInputConnection(self.arrow_source.GetOutputPort())
+        # Express force from current segment basis to global basis
+        forces = np.asarray(all_forces)[:, :, 0]
+        segment_jcs = np.asarray(segment_jcs)
+        rot_seg = segment_jcs[:, :3, :3]
+        trans_seg = segment_jcs[:, :3, 3]
+        force_application = np.einsum("nij,nj->ni", rot_seg, forces[:, :3]) + trans_seg
+        force_magnitude = np.einsum("nij,nj->ni", rot_seg, forces[:, 3:]) + trans_seg
+
+        # Normalize force for visualization
+        scale = normalization_ratio / np.asarray(max_forces)
+        force_vector = (force_magnitude - force_application) * scale[:, np.newaxis]
 
-            mapper.SetInputConnection(transform_polydata.GetOutputPort())
+        self._update_arrows_actor(self.force_actors[0], force_application.T, force_vector.T)
 
-            self.force_actors[i].SetMapper(mapper)
-            self.force_actors[i].GetProperty().SetColor(self.force_color)
-            self.force_actors[i].GetProperty().SetOpacity(self.force_opacity)
+        self.force_actors[0].GetProperty().SetColor(self.force_color)
+        self.force_actors[0].GetProperty().SetOpacity(self.force_opacity)
 
-    def new_gravity_vector(self, segment_rt, gravity, length, normalization_ratio, vector_color):
+    def new_gravity_vector(self, segment_rt, gravity, reference_length, normalization_ratio, vector_color):
         """
         Define a new gravity vector.
         Parameters
@@ -1845,59 +1955,32 @@ class VtkModel(QtWidgets.QWidget):
             homogenous matrix in which coordinates are applied
         gravity : np.ndarray
             gravity array with 3 application coordinates and 3 magnitude coordinates
-        length : float
-            absolut length of gravity vector to scale arrow
+        reference_length : float
+            length of the gravity vector that is drawn with a length of normalization_ratio
         normalization_ratio: float
             ratio to scale arrow
         vector_color: tuple
             tuple of RGB for vector color
 
         """
-        # Arrow visualization parameters
-        arrow_source = vtkArrowSource()
-        arrow_source.SetTipResolution(15)
-        arrow_source.SetShaftResolution(8)
-        arrow_source.SetShaftRadius(0.015)
-        arrow_source.SetTipLength(0.2)
-        arrow_source.SetTipRadius(0.08)
-
-        self.arrow_source = arrow_source
-
-        # Arrow orientation
-        transform = vtkTransform()
-        transform_polydata = vtkTransformPolyDataFilter()
-        transform_polydata.SetTransform(transform)
-        transform_polydata.SetInputConnection(arrow_source.GetOutputPort())
-
         rot_seg = segment_rt[:3, :3]
         trans_seg = segment_rt[:-1, 3:]
         force_magnitude = np.dot(rot_seg, gravity[3:])
         force_magnitude = force_magnitude + trans_seg.reshape(3)
         force_application = np.dot(rot_seg, gravity[:3])
         force_application = force_application + trans_seg.reshape(3)
-        application_point = [force_application[0], force_application[1], force_application[2]]
-        magnitude_point = [force_magnitude[0], force_magnitude[1], force_magnitude[2]]
-
-        # Compute a basis for the arrow scaling
-        matrix, length = self.compute_basis_force(application_point, magnitude_point)
+        vector = force_magnitude - force_application
+        length = np.linalg.norm(vector)
 
         # Normalize force for visualization
-        length = length * normalization_ratio / length
-        transform = vtkTransform()
-        transform.Translate(application_point)
-        transform.Concatenate(matrix)
-        transform.Scale(length, length, length)
+        direction = vector / length
+        length = length * normalization_ratio / reference_length
 
         # Create an actor
-        mapper = vtkPolyDataMapper()
-
-        transform_polydata = vtkTransformPolyDataFilter()
-        transform_polydata.SetTransform(transform)
-        transform_polydata.SetInputConnection(self.arrow_source.GetOutputPort())
-        mapper.SetInputConnection(transform_polydata.GetOutputPort())
-
-        self.gravity_actors = vtkActor()
-        self.gravity_actors.SetMapper(mapper)
+        self.gravity_actors = self._new_arrows_actor(self.arrow_source)
+        self._update_arrows_actor(
+            self.gravity_actors, force_application[:, np.newaxis], (direction * length)[:, np.newaxis]
+        )
         self.gravity_actors.GetProperty().SetColor(vector_color)
 
         self.parent_window.ren.AddActor(self.gravity_actors)
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 try:
@@ -6,12 +8,17 @@ except ImportError:
     import biorbd_casadi as biorbd
     import casadi
 
+# The frames of a batch are independent, casadi can split them between threads. Past a few threads the gain vanishes
+_MAX_BATCH_THREADS = min(8, os.cpu_count() or 1)
+
 
 class InterfacesCollections:
     class BiorbdFunc:
         def __init__(self, model):
             self.m = model
             self.data = None
+            self.batch_function = None
+            self._mapped_functions = dict()
             if biorbd.currentLinearAlgebraBackend() == 0:
                 self._prepare_function_for_eigen()
                 self.get_data_func = self._get_data_from_eigen
@@ -37,6 +44,30 @@ class InterfacesCollections:
             self.get_data_func(**kwargs)
             return self.data
 
+        def get_data_batched(self, Q):
+            """
+            Evaluate the function for all the frames of a trajectory. If the casadi function can be mapped, all the
+            frames are computed in a single call spread over several threads, otherwise the frames are computed one
+            after the other
+            Parameters
+            ----------
+            Q : np.ndarray
+                The generalized coordinates of each frame (nbQ x n_frames)
+            Returns
+            -------
+            The data of all the frames stacked along the last (time) axis
+            """
+            Q = np.asarray(Q)
+            n_frames = Q.shape[1]
+            if self.batch_function is None:
+                return np.concatenate([np.array(self.get_data(Q=Q[:, i])) for i in range(n_frames)], axis=-1)
+
+            if n_frames not in self._mapped_functions:
+                self._mapped_functions[n_frames] = self.batch_function.map(n_frames, "thread", _MAX_BATCH_THREADS)
+            data = np.array(self._mapped_functions[n_frames](Q))
+            # The mapped function concatenates the frames horizontally
+            return data.reshape(data.shape[0], n_frames, data.shape[1] // n_frames).transpose(0, 2, 1)
+
     class Markers(BiorbdFunc):
         def __init__(self, model):
             super().__init__(model)
@@ -45,14 +76,15 @@ class InterfacesCollections:
         def _prepare_function_for_casadi(self):
             q_sym = casadi.MX.sym("Q", self.m.nbQ(), 1)
             self.markers = biorbd.to_casadi_func("Markers", self.m.markers, q_sym)
+            self.batch_function = self.markers
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
             if compute_kin:
                 markers = self.m.markers(Q, True, True)
             else:
                 markers = self.m.markers(Q, True, False)
-            for i in range(self.m.nbMarkers()):
-                self.data[:, i, 0] = markers[i].to_array()
+            if self.m.nbMarkers():
+                self.data[:, :, 0] = np.stack([marker.to_array() for marker in markers], axis=1)
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
             if self.m.nbMarkers():
@@ -66,14 +98,15 @@ class InterfacesCollections:
         def _prepare_function_for_casadi(self):
             q_sym = casadi.MX.sym("Q", self.m.nbQ(), 1)
             self.contacts = biorbd.to_casadi_func("Contacts", self.m.constraintsInGlobal, q_sym, True)
+            self.batch_function = self.contacts
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
             if compute_kin:
                 contacts = self.m.constraintsInGlobal(Q, True)
             else:
                 contacts = self.m.constraintsInGlobal(Q, False)
-            for i in range(self.m.nbContacts()):
-                self.data[:, i, 0] = contacts[i].to_array()
+            if self.m.nbContacts():
+                self.data[:, :, 0] = np.stack([contact.to_array() for contact in contacts], axis=1)
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
             if self.m.nbContacts():
@@ -87,14 +120,15 @@ class InterfacesCollections:
         def _prepare_function_for_casadi(self):
             q_sym = casadi.MX.sym("Q", self.m.nbQ(), 1)
             self.soft_contacts = biorbd.to_casadi_func("SoftContacts", self.m.softContacts, q_sym, True)
+            self.batch_function = self.soft_contacts
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
             if compute_kin:
                 soft_contacts = self.m.softContacts(Q, True)
             else:
                 soft_contacts = self.m.softContacts(Q, False)
-            for i in range(self.m.nbSoftContacts()):
-                self.data[:, i, 0] = soft_contacts[i].to_array()
+            if self.m.nbSoftContacts():
+                self.data[:, :, 0] = np.stack([contact.to_array() for contact in soft_contacts], axis=1)
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
             if self.m.nbContacts():
@@ -114,8 +148,7 @@ class InterfacesCollections:
                 CoM = self.m.CoM(Q)
             else:
                 CoM = self.m.CoM(Q, False)
-            for i in range(self.m.nbSegment()):
-                self.data[:3, 0, 0] = CoM.to_array()
+            self.data[:3, 0, 0] = CoM.to_array()
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
             self.data[:3, :, 0] = self.CoM(Q)
@@ -132,99 +165,97 @@ class InterfacesCollections:
             self.gravity = biorbd.to_casadi_func("Gravity", self.m.getGravity)
 
         def _get_data_from_casadi(self):
-            self.data = self.gravity()
-            for key in self.data.keys():
-                self.data = np.array(self.data[key]).reshape(3)
+            # The Function has a single output
+            self.data = np.array(next(iter(self.gravity().values()))).reshape(3)
 
     class CoMbySegment(BiorbdFunc):
         def __init__(self, model):
             super().__init__(model)
-            self.data = np.ndarray((3, 1, 1))
+            # The homogeneous coordinate of each CoM is set once, only the position is written afterward
+            self.data = np.ones((self.m.nbSegment(), 4, 1))
 
         def _prepare_function_for_casadi(self):
             Qsym = casadi.MX.sym("Q", self.m.nbQ(), 1)
             self.CoMs = biorbd.to_casadi_func("CoMbySegment", self.m.CoMbySegmentInMatrix, Qsym)
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
-            self.data = []
             if compute_kin:
                 allCoM = self.m.CoMbySegment(Q)
             else:
                 allCoM = self.m.CoMbySegment(Q, False)
-            for com in allCoM:
-                self.data.append(np.append(com.to_array(), 1))
+            for i, com in enumerate(allCoM):
+                self.data[i, :3, 0] = com.to_array()
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
-            self.data = []
-            for i in range(self.m.nbSegment()):
-                self.data.append(np.append(self.CoMs(Q)[:, i], 1))
+            self.data[:, :3, 0] = np.array(self.CoMs(Q)).T
 
     class MusclesPointsInGlobal(BiorbdFunc):
         def __init__(self, model):
+            # The muscles are fetched once, they are updated in place by the model
+            self.muscles = [
+                model.muscleGroup(group_idx).muscle(muscle_idx)
+                for group_idx in range(model.nbMuscleGroups())
+                for muscle_idx in range(model.muscleGroup(group_idx).nbMuscles())
+            ]
             super().__init__(model)
 
         def _prepare_function_for_casadi(self):
             Qsym = casadi.MX.sym("Q", self.m.nbQ(), 1)
-            self.groups = []
-            for group_idx in range(self.m.nbMuscleGroups()):
-                muscles = []
-                for muscle_idx in range(self.m.muscleGroup(group_idx).nbMuscles()):
-                    musc = self.m.muscleGroup(group_idx).muscle(muscle_idx)
-                    for via in range(len(musc.musclesPointsInGlobal())):
-                        muscles.append(
-                            casadi.Function(
-                                "MusclesPointsInGlobal", [Qsym], [musc.musclesPointsInGlobal(self.m, Qsym)[via].to_mx()]
-                            ).expand()
-                        )
-                self.groups.append(muscles)
-
-        def _get_data_from_eigen(self, Q=None):
-            self.data = []
-            self.m.updateMuscles(Q, True)
-            idx = 0
-            for group_idx in range(self.m.nbMuscleGroups()):
-                for muscle_idx in range(self.m.muscleGroup(group_idx).nbMuscles()):
-                    musc = self.m.muscleGroup(group_idx).muscle(muscle_idx)
-                    for k, pts in enumerate(musc.position().pointsInGlobal()):
-                        self.data.append(pts.to_array()[:, np.newaxis])
-                    idx += 1
-
-        def _get_data_from_casadi(self, Q=None):
-            self.data = []
-            for g in self.groups:
-                for m in g:
-                    self.data.append(np.array(m(Q)))
+            # All the via points are computed by a single Function so casadi can share the kinematics between them
+            points = []
+            for musc in self.muscles:
+                points += [pts.to_mx() for pts in musc.musclesPointsInGlobal(self.m, Qsym)]
+            self.points = casadi.Function(
+                "MusclesPointsInGlobal", [Qsym], [casadi.horzcat(*points, casadi.MX(3, 0))]
+            ).expand()
+            self.data = np.ndarray((len(points), 3, 1))
+
+        def _get_data_from_eigen(self, Q=None, compute_kin=True):
+            self.m.updateMuscles(Q, compute_kin)
+            points = []
+            for musc in self.muscles:
+                points.extend(musc.position().pointsInGlobal())
+            self._set_points(points)
+
+        def _get_data_from_casadi(self, Q=None, compute_kin=True):
+            self.data[:, :, 0] = np.array(self.points(Q)).T
+
+        def _set_points(self, points):
+            if self.data is None or self.data.shape[0] != len(points):
+                self.data = np.ndarray((len(points), 3, 1))
+            if points:
+                self.data[:, :, 0] = np.stack([pts.to_array() for pts in points])
 
     class LigamentsPointsInGlobal(BiorbdFunc):
         def __init__(self, model):
+            # The ligaments are fetched once, they are updated in place by the model
+            self.ligaments = [model.ligament(ligament_idx) for ligament_idx in range(model.nbLigaments())]
             super().__init__(model)
 
         def _prepare_function_for_casadi(self):
             Qsym = casadi.MX.sym("Q", self.m.nbQ(), 1)
-            self.ligaments = []
-            for ligament_idx in range(self.m.nbLigaments()):
-                ligament = self.m.ligament(ligament_idx)
-                for via in range(len(ligament.ligamentsPointsInGlobal())):
-                    self.ligaments.append(
-                        casadi.Function(
-                            "pointsInGlobal", [Qsym], [ligament.ligamentsPointsInGlobal(self.m, Qsym)[via].to_mx()]
-                        ).expand()
-                    )
-
-        def _get_data_from_eigen(self, Q=None):
-            self.data = []
-            self.m.updateLigaments(Q, True)
-            idx = 0
-            for ligament_idx in range(self.m.nbLigaments()):
-                ligament = self.m.ligament(ligament_idx)
-                for k, pts in enumerate(ligament.position().pointsInGlobal()):
-                    self.data.append(pts.to_array()[:, np.newaxis])
-                idx += 1
-
-        def _get_data_from_casadi(self, Q=None):
-            self.data = []
-            for l in self.ligaments:
-                self.data.append(np.array(l(Q)))
+            # All the via points are computed by a single Function so casadi can share the kinematics between them
+            points = []
+            for ligament in self.ligaments:
+                points += [pts.to_mx() for pts in ligament.ligamentsPointsInGlobal(self.m, Qsym)]
+            self.points = casadi.Function("pointsInGlobal", [Qsym], [casadi.horzcat(*points, casadi.MX(3, 0))]).expand()
+            self.data = np.ndarray((len(points), 3, 1))
+
+        def _get_data_from_eigen(self, Q=None, compute_kin=True):
+            self.m.updateLigaments(Q, compute_kin)
+            points = []
+            for ligament in self.ligaments:
+                points.extend(ligament.position().pointsInGlobal())
+            self._set_points(points)
+
+        def _get_data_from_casadi(self, Q=None, compute_kin=True):
+            self.data[:, :, 0] = np.array(self.points(Q)).T
+
+        def _set_points(self, points):
+            if self.data is None or self.data.shape[0] != len(points):
+                self.data = np.ndarray((len(points), 3, 1))
+            if points:
+                self.data[:, :, 0] = np.stack([pts.to_array() for pts in points])
 
     class MeshColor:
         @staticmethod
@@ -251,6 +282,11 @@ class InterfacesCollections:
                 self.segments.append(
                     casadi.Function("MeshPointsInMatrix", [Qsym], [self.m.meshPointsInMatrix(Qsym)[i].to_mx()]).expand()
                 )
+            # The vertices of each segment are written in the same buffers every frame
+            self.data = [
+                np.ndarray((3, self.m.segment(i).characteristics().mesh().nbVertex(), 1))
+                for i in range(self.m.nbSegment())
+            ]
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
             self.data = []
@@ -262,30 +298,25 @@ class InterfacesCollections:
                 self.data.append(meshPointsInMatrix[i].to_array()[:, :, np.newaxis])
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
-            self.data = []
-            for i in range(self.m.nbSegment()):
-                n_vertex = self.m.segment(i).characteristics().mesh().nbVertex()
-                vertices = np.ndarray((3, n_vertex, 1))
+            for i, vertices in enumerate(self.data):
                 vertices[:, :, 0] = self.segments[i](Q)
-                self.data.append(vertices)
 
     class AllGlobalJCS(BiorbdFunc):
         def __init__(self, model):
             super().__init__(model)
+            self.data = np.ndarray((self.m.nbSegment(), 4, 4))
 
         def _prepare_function_for_casadi(self):
             Qsym = casadi.MX.sym("Q", self.m.nbQ(), 1)
-            self.jcs = []
-            for i in range(self.m.nbSegment()):
-                self.jcs.append(casadi.Function("allGlobalJCS", [Qsym], [self.m.allGlobalJCS(Qsym)[i].to_mx()]))
+            # All the JCS are computed by a single Function so casadi can share the kinematics between them
+            all_jcs = [jcs.to_mx() for jcs in self.m.allGlobalJCS(Qsym)]
+            self.jcs = casadi.Function("allGlobalJCS", [Qsym], [casadi.horzcat(*all_jcs, casadi.MX(4, 0))]).expand()
 
         def _get_data_from_eigen(self, Q=None, compute_kin=True):
-            self.data = []
             allJCS = self.m.allGlobalJCS(Q, compute_kin)
-            for jcs in allJCS:
-                self.data.append(jcs.to_array())
+            for i, jcs in enumerate(allJCS):
+                self.data[i] = jcs.to_array()
 
         def _get_data_from_casadi(self, Q=None, compute_kin=True):
-            self.data = []
-            for i in range(self.m.nbSegment()):
-                self.data.append(np.array(self.jcs[i](Q)))
+            # The JCS are concatenated horizontally, one 4x4 block per segment
+            self.data[:] = np.array(self.jcs(Q)).reshape(4, self.m.nbSegment(), 4).transpose(1, 0, 2)
@@ -15,9 +15,8 @@ class Mesh(Markers):
         automatic_triangles = False
         if s[1] == 0 and vertex.shape[1] > 0:
             automatic_triangles = True
-            triangles = np.ndarray((3, vertex.shape[1] - 1), dtype="int")
-            for i in range(vertex.shape[1] - 1):
-                triangles[:, i] = [i, i + 1, i]
+            idx = np.arange(vertex.shape[1] - 1, dtype="int")
+            triangles = np.stack((idx, idx + 1, idx))
 
         attrs = {"triangles": triangles, "automatic_triangles": automatic_triangles}
         return Markers.__new__(cls, vertex, None, None, attrs=attrs, **kwargs)
@@ -24,29 +24,41 @@ class RectangleOnSlider(QWidget):
         self.value = -1
         self.is_selected = False
 
-    def _compute_value_position(self, value):
-        n_elements = self.slider.maximum() - self.slider.minimum()
-        proportion = value / n_elements
-        return proportion * self.slider.width()
+        # Keep the inverse of the range of the slider so painting does not have to query and divide it each time
+        self._inv_range = 0
+        self._on_range_changed(self.slider.minimum(), self.slider.maximum())
+        self.slider.rangeChanged.connect(self._on_range_changed)
+
+    def _on_range_changed(self, minimum: int, maximum: int):
+        self._inv_range = 1 / (maximum - minimum) if maximum != minimum else 0
+
+    def _compute_value_position(self, value, width):
+        return value * self._inv_range * width
 
     def paintEvent(self, event):
         if self.value < 0:
             return
 
-        paint = QPainter()
-        paint.begin(self)
-        paint.setPen(Qt.black)
-        paint.setBrush(self.color if not self.is_selected else Qt.black)
-        paint.setOpacity(0.75)
-
-        position = int(self._compute_value_position(self.value))
+        width = self.slider.width()
+        height = self.slider.height() - 1
+        position = int(self._compute_value_position(self.value, width))
         if self.expand == RectangleOnSlider.Expand.ExpandLeft:
-            paint.drawRect(0, 0, position, self.slider.height() - 1)
+            rect = (0, 0, position, height)
         elif self.expand == RectangleOnSlider.Expand.ExpandRight:
-            paint.drawRect(position, 0, self.slider.width() - position - 1, self.slider.height() - 1)
+            rect = (position, 0, width - position - 1, height)
         elif self.expand == RectangleOnSlider.Expand.FixedSize:
-            paint.drawRect(int(position - self.size / 2) + 1, 0, self.size, self.slider.height() - 1)
+            rect = (int(position - self.size / 2) + 1, 0, self.size, height)
         else:
             raise NotImplementedError("Wrong value for expand")
 
+        # Do not start a painter for a rectangle that would not be visible
+        if rect[2] <= 0 or rect[3] <= 0 or rect[0] >= width or rect[0] + rect[2] <= 0:
+            return
+
+        paint = QPainter()
+        paint.begin(self)
+        paint.setPen(Qt.black)
+        paint.setBrush(self.color if not self.is_selected else Qt.black)
+        paint.setOpacity(0.75)
+        paint.drawRect(*rect)
         paint.end()
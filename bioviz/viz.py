@@ -1,6 +1,5 @@
 from typing import Union, Protocol
 import os
-import copy
 from functools import partial
 
 import numpy as np
@@ -28,7 +27,7 @@ from PyQt5.QtWidgets import (
     QRadioButton,
     QGroupBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPalette, QColor, QPixmap, QIcon
 
 from .analyses import MuscleAnalyses, C3dEditorAnalyses, LigamentAnalyses
@@ -42,6 +41,9 @@ check_version(pyomeca, "2024.0.1", "2024.1.0")
 
 from pyomeca import Markers
 
+# Maximum number of coordinates (frames x points x 3) precomputed for each kind of points of a movement (~200 MB)
+_MAX_PRECOMPUTED_VALUES = 50_000_000
+
 
 class AnalysePanel(Protocol):
     @property
@@ -148,6 +150,8 @@ class Viz:
         )
         self.is_executing = False
         self.animation_warning_already_shown = False
+        self._slider_update_pending = False
+        self._is_stepping_animation = False
 
         # Set Z vertical
         cam = self.vtk_window.ren.GetActiveCamera()
@@ -202,6 +206,11 @@ class Viz:
         # Create all the reference to the things to plot
         self.nQ = self.model.nbQ()
         self.Q = np.zeros(self.nQ)
+        self._drawn_q = None  # The Q the scene was last computed for
+        # Points of the loaded movement computed for all its frames at once, see _precompute_movement
+        self._precomputed_q = None
+        self._precomputed_points = dict()
+        self._animated_frame = None
         self.idx_markers_to_remove = []
         self.show_segment_is_on = [False] * self.model.nbSegment()
         if self.show_markers:
@@ -234,21 +243,19 @@ class Viz:
                 self.show_segment_is_on[i] = True
         if self.show_muscles:
             self.model.updateMuscles(self.Q, True)
-            self.muscles = []
-            for group_idx in range(self.model.nbMuscleGroups()):
-                for muscle_idx in range(self.model.muscleGroup(group_idx).nbMuscles()):
-                    musc = self.model.muscleGroup(group_idx).muscle(muscle_idx)
-                    tp = np.zeros((3, len(musc.position().pointsInGlobal()), 1))
-                    self.muscles.append(Mesh(vertex=tp))
             self.musclesPointsInGlobal = InterfacesCollections.MusclesPointsInGlobal(self.model)
+            # The muscles fetched by musclesPointsInGlobal are reused instead of going through the groups again
+            self.muscles = []
+            for musc in self.musclesPointsInGlobal.muscles:
+                tp = np.zeros((3, len(musc.position().pointsInGlobal()), 1))
+                self.muscles.append(Mesh(vertex=tp))
         if self.show_ligaments:
             self.model.updateLigaments(self.Q, True)
+            self.ligamentsPointsInGlobal = InterfacesCollections.LigamentsPointsInGlobal(self.model)
             self.ligaments = []
-            for ligament_idx in range(self.model.nbLigaments()):
-                ligament = self.model.ligament(ligament_idx)
+            for ligament in self.ligamentsPointsInGlobal.ligaments:
                 tp = np.zeros((3, len(ligament.position().pointsInGlobal()), 1))
                 self.ligaments.append(Mesh(vertex=tp))
-            self.ligamentsPointsInGlobal = InterfacesCollections.LigamentsPointsInGlobal(self.model)
         if self.show_local_ref_frame or self.show_global_ref_frame:
             self.rt = []
             self.allGlobalJCS = InterfacesCollections.AllGlobalJCS(self.model)
@@ -314,11 +321,7 @@ class Viz:
             self.play_stop_push_button: QPushButton | None = None
             self.is_animating = False
             self.is_recording = False
-            self.start_icon = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/start.png"))
-            self.pause_icon = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/pause.png"))
-            self.record_icon = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/record.png"))
-            self.add_icon = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/add.png"))
-            self.stop_icon = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/stop.png"))
+            self._icons = dict()  # Loaded the first time they are used, see _icon
             self.record_push_button = None
 
             self.double_factor = 10000
@@ -352,7 +355,7 @@ class Viz:
             self._set_gravity_vector()
 
     def reset_q(self):
-        self.Q = np.zeros(self.Q.shape)
+        self.Q[:] = 0
         for slider in self.sliders:
             slider[1].setValue(0)
             slider[2].setText(f"{0:.2f}")
@@ -375,14 +378,21 @@ class Viz:
             refresh_window: bool
                 If the window should be refreshed now or not
         """
-        if isinstance(Q, (tuple, list)):
-            Q = np.array(Q)
-
-        if not isinstance(Q, np.ndarray) and len(Q.shape) > 1 and Q.shape[0] != self.nQ:
+        Q = np.asarray(Q, dtype=float)
+        if Q.size != self.nQ:
             raise TypeError(f"Q should be a {self.nQ} column vector")
-        self.Q = Q
+        # Q is copied into the same buffer each time so biorbd always receives the same contiguous array
+        np.copyto(self.Q, Q.reshape(self.nQ))
 
+        # The kinematics is always updated as other parts (e.g. the analyses) may have moved the model since last call
         self.model.UpdateKinematicsCustom(self.Q)
+        if self._drawn_q is not None and np.array_equal(self.Q, self._drawn_q):
+            # Nothing moved since the last call, the scene is already up to date
+            if refresh_window:
+                self.refresh_window()
+            return
+        self._drawn_q = self.Q.copy()
+
         self._set_muscles_from_q()
         self._set_ligaments_from_q()
         self._set_rt_from_q()
@@ -394,13 +404,17 @@ class Viz:
         self._set_soft_contacts_from_q()
         self._set_wrapping_from_q()
 
-        # Update the sliders
+        # Update the sliders, only the ones that moved are touched so Qt does not restyle all of them each frame
         if self.show_analyses_panel:
             for i, slide in enumerate(self.sliders):
-                slide[1].blockSignals(True)
-                slide[1].setValue(int(self.Q[i] * self.double_factor))
-                slide[1].blockSignals(False)
-                slide[2].setText(f"{self.Q[i]:.2f}")
+                value = int(self.Q[i] * self.double_factor)
+                if slide[1].value() != value:
+                    slide[1].blockSignals(True)
+                    slide[1].setValue(value)
+                    slide[1].blockSignals(False)
+                text = f"{self.Q[i]:.2f}"
+                if slide[2].text() != text:
+                    slide[2].setText(text)
 
         if refresh_window:
             self.refresh_window()
@@ -419,6 +433,10 @@ class Viz:
         self.vtk_window.set_camera_roll(roll)
         self.refresh_window()
 
+    def reset_camera_to_scene(self):
+        self.vtk_window.reset_camera_to_scene()
+        self.refresh_window()
+
     def get_camera_zoom(self) -> float:
         return self.vtk_window.get_camera_zoom()
 
@@ -463,6 +481,8 @@ class Viz:
 
     def update(self):
         if self.show_analyses_panel and self.is_animating:
+            # Moving the slider updates the scene, but it is only rendered once by the refresh_window below
+            self._is_stepping_animation = True
             self.movement_slider[0].setValue(self.movement_slider[0].value() + 1)
 
             if self.movement_slider[0].value() >= self.movement_last_frame:
@@ -472,6 +492,7 @@ class Viz:
                 self.add_frame()
                 if self.movement_slider[0].value() == self.movement_last_frame:
                     self._start_stop_animation()
+            self._is_stepping_animation = False
         self.refresh_window()
 
     def resize(self, width: int, height: int):
@@ -480,6 +501,11 @@ class Viz:
     def exec(self):
         self.is_executing = True
         while self.vtk_window.is_active:
+            if not (self.show_analyses_panel and self.is_animating):
+                # Nothing moves by itself, so instead of spinning the scene is only redrawn after something happened
+                self.vtk_window.wait_for_events()
+                if not self.vtk_window.is_active:
+                    break
             self.update()
         self.is_executing = False
 
@@ -489,6 +515,18 @@ class Viz:
     def maximize(self):
         self.vtk_window.showMaximized()
 
+    def _icon(self, name: str) -> QIcon:
+        """
+        Get the icon of a button, the image is only read from the ressources the first time it is needed
+        Parameters
+        ----------
+        name : str
+            The name of the image in the ressources folder (without the .png extension)
+        """
+        if name not in self._icons:
+            self._icons[name] = QIcon(QPixmap(f"{os.path.dirname(__file__)}/ressources/{name}.png"))
+        return self._icons[name]
+
     def set_viz_palette(self):
         self.palette_active.setColor(QPalette.WindowText, QColor(Qt.black))
         self.palette_active.setColor(QPalette.ButtonText, QColor(Qt.black))
@@ -535,6 +573,8 @@ class Viz:
                 slider.setPageStep(self.double_factor)
                 slider.setValue(0)
                 slider.valueChanged.connect(self._move_avatar_from_sliders)
+                # Make sure the model is at the released position before the graphs are updated
+                slider.sliderReleased.connect(self._move_avatar_to_sliders_position)
                 slider.sliderReleased.connect(partial(self._update_ligament_analyses_graphs, False, False, False))
                 slider.sliderReleased.connect(partial(self._update_muscle_analyses_graphs, False, False, False, False))
                 slider_layout.addWidget(slider)
@@ -640,7 +680,7 @@ class Viz:
 
         # Controllers
         self.play_stop_push_button = QPushButton()
-        self.play_stop_push_button.setIcon(self.start_icon)
+        self.play_stop_push_button.setIcon(self._icon("start"))
         self.play_stop_push_button.setPalette(self.palette_active)
         self.play_stop_push_button.setEnabled(False)
         self.play_stop_push_button.released.connect(self._start_stop_animation)
@@ -655,14 +695,14 @@ class Viz:
         animation_slider_layout.addWidget(slider)
 
         self.record_push_button = QPushButton()
-        self.record_push_button.setIcon(self.record_icon)
+        self.record_push_button.setIcon(self._icon("record"))
         self.record_push_button.setPalette(self.palette_active)
         self.record_push_button.setEnabled(True)
         self.record_push_button.released.connect(self.start_recording)
         animation_slider_layout.addWidget(self.record_push_button)
 
         self.stop_record_push_button = QPushButton()
-        self.stop_record_push_button.setIcon(self.stop_icon)
+        self.stop_record_push_button.setIcon(self._icon("stop"))
         self.stop_record_push_button.setPalette(self.palette_active)
         self.stop_record_push_button.setEnabled(False)
         self.stop_record_push_button.released.connect(self.stop_recording)
@@ -791,10 +831,18 @@ class Viz:
         self._update_ligament_analyses_graphs(False, False, False)
 
     def _move_avatar_from_sliders(self):
-        for i, slide in enumerate(self.sliders):
-            self.Q[i] = slide[1].value() / self.double_factor
-            slide[2].setText(f" {self.Q[i]:.2f}")
-        self.set_q(self.Q)
+        # Dragging a slider emits a value for each pixel it moves. Instead of computing the model for each of them, the
+        # values are coalesced and the model is only moved once per display frame (~16 ms)
+        if self._slider_update_pending:
+            return
+        self._slider_update_pending = True
+        QTimer.singleShot(16, self._move_avatar_to_sliders_position)
+
+    def _move_avatar_to_sliders_position(self):
+        self._slider_update_pending = False
+        # The value labels are updated by set_q
+        values = np.fromiter((slide[1].value() for slide in self.sliders), dtype=float, count=len(self.sliders))
+        self.set_q(values / self.double_factor)
 
     @property
     def n_events(self) -> int:
@@ -873,8 +921,10 @@ class Viz:
         if self.animated_Q is not None:
             t_slider = self.movement_slider[0].value() - 1
             t = t_slider if t_slider < self.animated_Q.shape[0] else self.animated_Q.shape[0] - 1
-            self.Q = copy.copy(self.animated_Q[t, :])  # 1-based
-            self.set_q(self.Q, refresh_window=False)
+            # The frame is copied by set_q into the Q buffer (the slider is 1-based)
+            self._animated_frame = t
+            self.set_q(self.animated_Q[t, :], refresh_window=False)
+            self._animated_frame = None
 
         self._set_experimental_markers_from_frame()
         self._set_experimental_forces_from_frame()
@@ -884,8 +934,9 @@ class Viz:
         # Update graph of ligament analyses
         self._update_ligament_analyses_graphs(True, True, True)
 
-        # Refresh the window
-        self.refresh_window()
+        # Refresh the window, unless the frame is drawn by the update of the animation
+        if not self._is_stepping_animation:
+            self.refresh_window()
 
     def _start_stop_animation(self):
         if not self.is_executing and not self.animation_warning_already_shown:
@@ -900,12 +951,12 @@ class Viz:
             self.animation_warning_already_shown = True
         if self.is_animating:
             self.is_animating = False
-            self.play_stop_push_button.setIcon(self.start_icon)
+            self.play_stop_push_button.setIcon(self._icon("start"))
             self.record_push_button.setEnabled(True)
             self.stop_record_push_button.setEnabled(self.is_recording)
         else:
             self.is_animating = True
-            self.play_stop_push_button.setIcon(self.pause_icon)
+            self.play_stop_push_button.setIcon(self._icon("pause"))
             self.record_push_button.setEnabled(False)
             self.stop_record_push_button.setEnabled(False)
 
@@ -946,7 +997,7 @@ class Viz:
                 raise ValueError("The only supported format for video is .ogv")
             file_name += ".ogv"
 
-            self.record_push_button.setIcon(self.add_icon)
+            self.record_push_button.setIcon(self._icon("add"))
             self.stop_record_push_button.setEnabled(True)
             self.is_recording = True
 
@@ -956,7 +1007,7 @@ class Viz:
 
         if finish:
             self.is_recording = False
-            self.record_push_button.setIcon(self.record_icon)
+            self.record_push_button.setIcon(self._icon("record"))
             self.stop_record_push_button.setEnabled(False)
 
     def _load_movement_from_button(self):
@@ -985,6 +1036,7 @@ class Viz:
             self._start_stop_animation()
 
     def _load_movement(self):
+        self._precompute_movement()
         self._set_movement_slider()
 
         # Add the combobox in muscle analyses
@@ -994,11 +1046,55 @@ class Viz:
         if self.show_ligaments:
             self.analyses_ligament.add_movement_to_dof_choice()
 
+    def _precompute_movement(self):
+        """
+        Compute the points that only depend on Q (markers, contacts and soft contacts) for all the frames of the loaded
+        movement at once, so playing the animation picks them from these buffers instead of calling biorbd each frame
+        """
+        self._precomputed_q = self.animated_Q
+        self._precomputed_points = dict()
+        if self.animated_Q is None:
+            return
+
+        all_q = np.ascontiguousarray(self.animated_Q.T, dtype=float)
+        to_compute = {
+            "markers": self.Markers if self.show_markers else None,
+            "contacts": self.Contacts if self.show_contacts else None,
+            "soft_contacts": self.SoftContacts if self.show_soft_contacts else None,
+        }
+        for name, func in to_compute.items():
+            if func is None or func.batch_function is None:
+                # Without a batched function (eigen backend), each frame would go through the full kinematics once more
+                # on top of the one set_q does anyway, so these points are computed live
+                continue
+            if all_q.shape[1] * func.data.shape[1] * 3 > _MAX_PRECOMPUTED_VALUES:
+                # Too long a movement to keep in memory, the points are computed live
+                continue
+            # The frames are stored one after the other (frame x xyz x point) so each frame is a contiguous block. They
+            # are kept in float32, the precision VTK draws them with, which halves the memory of long movements
+            points = func.get_data_batched(all_q)
+            self._precomputed_points[name] = np.ascontiguousarray(points.transpose(2, 0, 1), dtype=np.float32)
+
+    def _precomputed_points_of_frame(self, name: str):
+        """
+        The precomputed points of the animated frame being drawn, None if they must be computed from Q
+        Parameters
+        ----------
+        name : str
+            The points to get ("markers", "contacts" or "soft_contacts")
+        """
+        if self._animated_frame is None or name not in self._precomputed_points:
+            return None
+        if self._precomputed_q is not self.animated_Q:
+            # The movement was changed without being loaded (e.g. by the Kinogram), the buffers are out of date
+            return None
+        return self._precomputed_points[name][self._animated_frame, :, :, np.newaxis]
+
     def _set_movement_slider(self):
         # Activate the start button
         self.is_animating = False
         self.play_stop_push_button.setEnabled(True)
-        self.play_stop_push_button.setIcon(self.start_icon)
+        self.play_stop_push_button.setIcon(self._icon("start"))
 
         # Update the slider bar and frame count
         self.movement_slider[0].setEnabled(True)
@@ -1114,10 +1210,14 @@ class Viz:
         if not self.show_markers:
             return
 
-        self.markers[0:3, :, :] = self.Markers.get_data(Q=self.Q, compute_kin=False)
+        markers = self._precomputed_points_of_frame("markers")
+        if markers is None:
+            markers = self.Markers.get_data(Q=self.Q, compute_kin=False)
+        self.markers[0:3, :, :] = markers
         if self.idx_markers_to_remove:
             self.markers[0:3, self.idx_markers_to_remove, :] = np.nan
-        self.vtk_model.update_markers(self.markers.isel(time=[0]))
+        # The markers hold a single frame, their buffer is sent as is instead of selecting that frame in a new Markers
+        self.vtk_model.update_markers(self.markers.data)
 
     def _set_experimental_markers_from_frame(self):
         if not self.show_experimental_markers:
@@ -1174,14 +1274,20 @@ class Viz:
         if not self.show_contacts:
             return
 
-        self.contacts[0:3, :, :] = self.Contacts.get_data(Q=self.Q, compute_kin=False)
+        contacts = self._precomputed_points_of_frame("contacts")
+        if contacts is None:
+            contacts = self.Contacts.get_data(Q=self.Q, compute_kin=False)
+        self.contacts[0:3, :, :] = contacts
         self.vtk_model.update_contacts(self.contacts.isel(time=[0]))
 
     def _set_soft_contacts_from_q(self):
         if not self.show_soft_contacts:
             return
 
-        self.soft_contacts[0:3, :, :] = self.SoftContacts.get_data(Q=self.Q, compute_kin=False)
+        soft_contacts = self._precomputed_points_of_frame("soft_contacts")
+        if soft_contacts is None:
+            soft_contacts = self.SoftContacts.get_data(Q=self.Q, compute_kin=False)
+        self.soft_contacts[0:3, :, :] = soft_contacts
         self.vtk_model.update_soft_contacts(self.soft_contacts.isel(time=[0]))
 
     def _set_global_center_of_mass_from_q(self):
@@ -1189,7 +1295,7 @@ class Viz:
             return
 
         com = self.CoM.get_data(Q=self.Q, compute_kin=False)
-        self.global_center_of_mass.loc[{"channel": 0, "time": 0}] = com.squeeze()
+        self.global_center_of_mass[:, 0, 0] = com[:, 0, 0]
         self.vtk_model.update_global_center_of_mass(self.global_center_of_mass.isel(time=[0]))
 
     def _set_gravity_vector(self):
@@ -1217,48 +1323,48 @@ class Viz:
         if not self.show_segments_center_of_mass:
             return
 
+        # The CoMs are stacked (segment, xyz1, frame), they are written into the (xyz1, segment, frame) markers at once
         coms = self.CoMbySegment.get_data(Q=self.Q, compute_kin=False)
-        for k, com in enumerate(coms):
-            self.segments_center_of_mass.loc[{"channel": k, "time": 0}] = com.squeeze()
+        self.segments_center_of_mass[:, :, 0] = coms[:, :, 0].T
         self.vtk_model.update_segments_center_of_mass(self.segments_center_of_mass.isel(time=[0]))
 
     def _set_meshes_from_q(self):
         if not self.show_meshes:
             return
 
+        # The vertices are written in the numpy buffers of the meshes, bypassing the indexing machinery of xarray
         for m, meshes in enumerate(self.meshPointsInMatrix.get_data(Q=self.Q, compute_kin=False)):
             if self.show_segment_is_on[m]:
-                self.mesh[m][0:3, :, :] = meshes
+                self.mesh[m].data[0:3, :, :] = meshes
             else:
-                self.mesh[m][0:3, :, :] = np.nan
+                self.mesh[m].data[0:3, :, :] = np.nan
         self.vtk_model.update_mesh(self.mesh)
 
     def _set_muscles_from_q(self):
         if not self.show_muscles:
             return
 
-        muscles = self.musclesPointsInGlobal.get_data(Q=self.Q)
-        idx = 0
+        # The points of all the muscles follow each other, each mesh takes as many as it has channels
+        # The kinematics was already updated by set_q, only the muscles need to be
+        muscles = self.musclesPointsInGlobal.get_data(Q=self.Q, compute_kin=False)
         cmp = 0
-        for group_idx in range(self.model.nbMuscleGroups()):
-            for muscle_idx in range(self.model.muscleGroup(group_idx).nbMuscles()):
-                musc = self.model.muscleGroup(group_idx).muscle(muscle_idx)
-                for k, pts in enumerate(musc.position().pointsInGlobal()):
-                    self.muscles[idx].loc[{"channel": k, "time": 0}] = np.append(muscles[cmp], 1)
-                    cmp += 1
-                idx += 1
+        for muscle in self.muscles:
+            n_points = muscle.shape[1]
+            muscle.data[0:3, :, 0] = muscles[cmp : cmp + n_points, :, 0].T
+            cmp += n_points
         self.vtk_model.update_muscle(self.muscles)
 
     def _set_ligaments_from_q(self):
         if not self.show_ligaments:
             return
 
-        ligaments = self.ligamentsPointsInGlobal.get_data(Q=self.Q)
+        # The points of all the ligaments follow each other, each mesh takes as many as it has channels
+        ligaments = self.ligamentsPointsInGlobal.get_data(Q=self.Q, compute_kin=False)
         cmp = 0
-        for idx in range(self.model.nbLigaments()):
-            for k, pts in enumerate(self.model.ligament(idx).position().pointsInGlobal()):
-                self.ligaments[idx].loc[{"channel": k, "time": 0}] = np.append(ligaments[cmp], 1)
-                cmp += 1
+        for ligament in self.ligaments:
+            n_points = ligament.shape[1]
+            ligament.data[0:3, :, 0] = ligaments[cmp : cmp + n_points, :, 0].T
+            cmp += n_points
 
         self.vtk_model.update_ligament(self.ligaments)
 
@@ -1295,12 +1401,10 @@ class Viz:
         if not self.show_local_ref_frame:
             return
 
-        for k, rt in enumerate(self.allGlobalJCS.get_data(Q=self.Q, compute_kin=False)):
-            if self.show_segment_is_on[k]:
-                self.rt[k] = Rototrans(rt)
-            else:
-                self.rt[k] = Rototrans(np.eye(4)) * np.nan
-        self.vtk_model.update_rt(self.rt)
+        # The JCS are sent stacked in a single array, the ones of the hidden segments are not drawn
+        all_jcs = np.array(self.allGlobalJCS.get_data(Q=self.Q, compute_kin=False))
+        all_jcs[np.logical_not(self.show_segment_is_on)] = np.nan
+        self.vtk_model.update_rt(all_jcs)
 
 
 class Kinogram(Viz):
@@ -12,13 +12,14 @@ from pyomeca import Markers, Rototrans, Angles
 def main():
     # Path to the C3D file
     data_folder = f"{os.getcwd()}/../tests/data"
-    markers_c3d_file = f"{data_folder}markers_analogs.c3d"
+    markers_c3d_file = f"{data_folder}/markers_analogs.c3d"
 
-    # Load data
-    d = Markers.from_c3d(markers_c3d_file, usecols=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], prefix_delimiter=":")
-    d2 = Markers.from_c3d(markers_c3d_file, usecols=["CLAV_post", "PSISl", "STERr", "CLAV_post"], prefix_delimiter=":")
+    # Load data (the file is parsed once, the subsets are taken from the loaded markers)
+    all_markers = Markers.from_c3d(markers_c3d_file, prefix_delimiter=":")
+    d = all_markers.isel(channel=list(range(11)))
+    d2 = all_markers.sel(channel=["CLAV_post", "PSISl", "STERr", "CLAV_post"])
     # mean of first 3 markers
-    d3 = Markers.from_c3d(markers_c3d_file, usecols=[0, 1, 2], prefix_delimiter=":").mean("channel", keepdims=True)
+    d3 = all_markers.isel(channel=[0, 1, 2]).mean("channel", keepdims=True)
 
     # Create a windows with a nice gray background
     vtk_window = VtkWindow(background_color=(0.5, 0.5, 0.5))
@@ -59,42 +60,57 @@ def main():
     meshes = []
     meshes.append(Mesh(vertex=d, triangles=[[0, 1], [5, 0], [1, 6]]))
 
+    # Prepare everything that is known in advance so the animation loop only has to pick the current frame
+    n_frames = d.shape[2]
+    # The markers are copied frame-major so each frame is a contiguous block (the transpose brings it back to 4xN)
+    d_frames = np.ascontiguousarray(np.transpose(d.values, (2, 1, 0)))
+    d2_frames = np.ascontiguousarray(np.transpose(d2.values, (2, 1, 0)))
+    d3_frames = np.ascontiguousarray(np.transpose(d3.values, (2, 1, 0)))
+    angles = np.zeros((3, 1, n_frames))
+    angles[0, 0, :] = np.arange(n_frames) / n_frames * np.pi * 2
+    rotating_rt = Rototrans.from_euler_angles(
+        angles=Angles(angles),
+        angle_sequence="yxz",
+        translations=Markers(np.repeat(d[:, [0], [0]].values, n_frames, axis=2)),
+    )
+    rotating_rt_frames = [rotating_rt[:, :, [i]] for i in range(n_frames)]
+    # update_rt accepts the matrices stacked in a (n_rt, 4, 4) array, so a frame of this copy is sent as is
+    one_rt_frames = np.ascontiguousarray(np.transpose(one_rt.values, (2, 0, 1)))
+    mesh_frames = [[m[:, :, [i]] for m in meshes] for i in range(n_frames)]
+
     # Animate all this
     i = 0
     while vtk_window.is_active:
         # Update markers
         if i < 100:
-            vtk_model_real.update_markers(d[:, :, i])
-            vtk_model_pred.update_markers(d2[:, :, i])
-            vtk_model_mid.update_markers(d3[:, :, i])
+            vtk_model_real.update_markers(d_frames[i].T)
+            vtk_model_pred.update_markers(d2_frames[i].T)
+            vtk_model_mid.update_markers(d3_frames[i].T)
         else:
             # Dynamically change amount of markers for each Model
-            vtk_model_from_c3d.update_markers(d[:, :, i])
-            vtk_model_real.update_markers(d2[:, :, i])
-            vtk_model_pred.update_markers(d3[:, :, i])
+            vtk_model_from_c3d.update_markers(d_frames[i].T)
+            vtk_model_real.update_markers(d2_frames[i].T)
+            vtk_model_pred.update_markers(d3_frames[i].T)
 
         # Funky online update of markers characteristics
         if i > 150:
-            vtk_model_real.set_markers_color(((i % 255.0) / 255.0, (i % 255.0) / 255.0, (i % 255.0) / 255.0))
+            gray = (i % 255.0) / 255.0
+            vtk_model_real.set_markers_color((gray, gray, gray))
             vtk_model_from_c3d.set_markers_size((i % 150) / 20)
 
         # Rotate one system of axes
-        all_rt_real[0] = Rototrans.from_euler_angles(
-            angles=Angles(np.array([i / d.shape[2] * np.pi * 2, 0, 0])[:, np.newaxis, np.newaxis]),
-            angle_sequence="yxz",
-            translations=d[:, [0], [0]],
-        )
+        all_rt_real[0] = rotating_rt_frames[i]
         vtk_model_real.update_rt(all_rt_real)
 
         # Update another system of axes
-        vtk_model_pred.update_rt([one_rt[:, :, [i]]])
+        vtk_model_pred.update_rt(one_rt_frames[i : i + 1])
 
         # Update the meshing
-        vtk_model_real.update_mesh([m[:, :, [i]] for m in meshes])
+        vtk_model_real.update_mesh(mesh_frames[i])
 
         # Update window
         vtk_window.update_frame()
-        i = (i + 1) % d.shape[2]
+        i = (i + 1) % n_frames
 
     vtk_window.close()
 
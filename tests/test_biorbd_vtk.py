@@ -0,0 +1,139 @@
+import numpy as np
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+
+from bioviz.mesh import Mesh
+from bioviz.biorbd_vtk import (
+    _connectivity_to_vtk_cells,
+    _markers_to_vtk_points,
+    _new_lines_poly_data,
+    _new_meshes_poly_data,
+    _rt_to_axes_points,
+    _same_topology,
+    _triangles_to_vtk_cells,
+    _update_vtk_points,
+)
+
+
+def _cells_to_numpy(cells):
+    """
+    Get the offsets and the connectivity of a vtkCellArray
+    """
+    return vtk_to_numpy(cells.GetOffsetsArray()), vtk_to_numpy(cells.GetConnectivityArray())
+
+
+def test_mesh_automatic_triangles():
+    n_vertices = 6
+    mesh = Mesh(vertex=np.random.rand(3, n_vertices, 1))
+
+    # The triangles must be the same as the ones built vertex by vertex
+    expected = np.ndarray((3, n_vertices - 1), dtype="int")
+    for i in range(n_vertices - 1):
+        expected[:, i] = [i, i + 1, i]
+
+    assert mesh.automatic_triangles
+    np.testing.assert_array_equal(mesh.triangles, expected)
+
+
+def test_connectivity_to_vtk_cells():
+    connectivity = np.array([[0, 3], [1, 4], [2, 5]])
+    offsets, flat = _cells_to_numpy(_connectivity_to_vtk_cells(connectivity))
+
+    np.testing.assert_array_equal(offsets, [0, 3, 6])
+    np.testing.assert_array_equal(flat, [0, 1, 2, 3, 4, 5])
+
+
+def test_triangles_to_vtk_cells_closed():
+    triangles = np.array([[0, 1], [1, 2], [2, 3]])
+    offsets, flat = _cells_to_numpy(_triangles_to_vtk_cells(triangles, close=True))
+
+    # Each triangle gets its first vertex repeated so the polyline closes it
+    np.testing.assert_array_equal(offsets, [0, 4, 8])
+    np.testing.assert_array_equal(flat, [0, 1, 2, 0, 1, 2, 3, 1])
+
+
+def test_new_lines_poly_data_shifts_triangles():
+    meshes = [
+        Mesh(vertex=np.random.rand(3, 3, 1), triangles=np.array([[0], [1], [2]])),
+        Mesh(vertex=np.random.rand(3, 4, 1), triangles=np.array([[0, 1], [1, 2], [2, 3]])),
+    ]
+    poly_data = _new_lines_poly_data(meshes)
+
+    assert poly_data.GetNumberOfPoints() == 7
+    offsets, flat = _cells_to_numpy(poly_data.GetLines())
+    np.testing.assert_array_equal(offsets, [0, 4, 8, 12])
+    np.testing.assert_array_equal(flat, [0, 1, 2, 0, 3, 4, 5, 3, 4, 5, 6, 4])
+
+
+def test_new_meshes_poly_data():
+    meshes = [
+        Mesh(vertex=np.random.rand(3, 3, 1), triangles=np.array([[0], [1], [2]])),  # patch
+        Mesh(vertex=np.random.rand(3, 4, 1), triangles=np.array([[0, 1], [1, 2], [2, 3]])),  # wireframe
+        Mesh(vertex=np.random.rand(3, 1, 1)),  # A single vertex has no triangle, it is drawn as a vertex
+    ]
+    poly_data, mesh_of_each_cell = _new_meshes_poly_data(meshes, draw_patches=[True, False, True])
+
+    assert poly_data.GetNumberOfPoints() == 8
+    np.testing.assert_almost_equal(
+        vtk_to_numpy(poly_data.GetPoints().GetData()),
+        np.concatenate([mesh[:3, :, 0].T for mesh in meshes]),
+        decimal=6,
+    )
+
+    # The connectivity of each mesh is shifted by the number of vertices of the meshes before it
+    _, verts = _cells_to_numpy(poly_data.GetVerts())
+    np.testing.assert_array_equal(verts, [7])
+    _, lines = _cells_to_numpy(poly_data.GetLines())
+    np.testing.assert_array_equal(lines, [3, 4, 5, 3, 4, 5, 6, 4])
+    _, polys = _cells_to_numpy(poly_data.GetPolys())
+    np.testing.assert_array_equal(polys, [0, 1, 2])
+
+    # The cells are stored by VTK as the vertices, then the lines, then the polygons
+    np.testing.assert_array_equal(mesh_of_each_cell, [2, 1, 1, 0])
+
+
+def test_same_topology():
+    triangles = np.array([[0, 1], [1, 2], [2, 3]])
+    mesh = Mesh(vertex=np.random.rand(3, 4, 1), triangles=triangles)
+
+    assert _same_topology(Mesh(vertex=np.random.rand(3, 4, 1), triangles=triangles.copy()), mesh)
+    assert not _same_topology(Mesh(vertex=np.random.rand(3, 5, 1), triangles=triangles), mesh)
+    assert not _same_topology(Mesh(vertex=np.random.rand(3, 4, 1), triangles=triangles[:, :1]), mesh)
+
+
+def test_update_vtk_points_in_place():
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(_markers_to_vtk_points(np.random.rand(3, 5)))
+    buffer = poly_data.GetPoints().GetData()
+
+    new_points = np.random.rand(3, 5)
+    _update_vtk_points(poly_data, new_points)
+
+    # Same number of points, the coordinates are written in the same buffer
+    assert poly_data.GetPoints().GetData() is buffer
+    np.testing.assert_almost_equal(vtk_to_numpy(buffer), new_points.T, decimal=6)
+
+    # A different number of points needs a new buffer
+    _update_vtk_points(poly_data, np.random.rand(3, 6))
+    assert poly_data.GetPoints().GetNumberOfPoints() == 6
+
+
+def test_rt_to_axes_points():
+    matrices = np.repeat(np.identity(4)[np.newaxis, :, :], 2, axis=0)
+    matrices[1, :3, 3] = [1, 2, 3]
+    points = _rt_to_axes_points(matrices, length=2)
+
+    # Each system of axes is its origin followed by the tips of its x, y and z axes
+    expected = np.array(
+        [
+            [0, 0, 0],
+            [2, 0, 0],
+            [0, 2, 0],
+            [0, 0, 2],
+            [1, 2, 3],
+            [3, 2, 3],
+            [1, 4, 3],
+            [1, 2, 5],
+        ]
+    ).T
+    np.testing.assert_almost_equal(points, expected)
@@ -0,0 +1,27 @@
+import os
+
+import biorbd
+import numpy as np
+
+from bioviz.interfaces_collection import InterfacesCollections
+
+
+def get_base_folder():
+    """
+    Return the base folder path (one level up from the tests folder)
+    """
+    return f"{os.path.join(os.path.dirname(os.path.abspath(__file__)))}/.."
+
+
+def test_markers_get_data_batched():
+    model = biorbd.Model(f"{get_base_folder()}/examples/pyomecaman.bioMod")
+    markers = InterfacesCollections.Markers(model)
+
+    n_frames = 5
+    all_q = np.random.default_rng(42).uniform(-1, 1, (model.nbQ(), n_frames))
+    batched = markers.get_data_batched(all_q)
+
+    # The frames are stacked on the time axis, each of them equal to what get_data computes for that frame
+    assert batched.shape == (3, model.nbMarkers(), n_frames)
+    for i in range(n_frames):
+        np.testing.assert_almost_equal(batched[:, :, i : i + 1], markers.get_data(Q=all_q[:, i]))